@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+
+def gridNeighbors(index: int, rows: int, cols: int) -> list[int]:
+    """_summary_ the cells next to a cell of a row-major grid, north, south, west then east,
+    leaving out those off the edge (blocked or not)
+
+    Args:
+        index (int): row-major index of the cell
+        rows (int): number of rows in the grid
+        cols (int): number of columns in the grid
+
+    Returns:
+        list[int]: the row-major indices of the neighbors
+    """
+    row, col = divmod(index, cols)
+    neighbors = []
+    if row > 0:        neighbors.append(index - cols)
+    if row < rows - 1: neighbors.append(index + cols)
+    if col > 0:        neighbors.append(index - 1)
+    if col < cols - 1: neighbors.append(index + 1)
+    return neighbors
+
+class ComponentLabels:
+    """_summary_ labels every open cell of a row-major grid with the connected component
+    (of 4-connected open cells) it belongs to, so whether one cell can reach another is a
+    single comparison of labels; blocked cells are labelled -1
+
+    The labels are built with one sweep over the grid plus a union-find of the labels
+    handed out during it, and are kept up to date as single cells are blocked or cleared:
+    clearing a cell merges the components around it (relabelling all but the largest),
+    and blocking one searches outward from each of its open neighbors in turn, stopping as
+    soon as all but one of those searches have either met another or run out of cells, so
+    only the pieces that were cut off get relabelled
+    """
+    __slots__ = ('_labels', '_sizes', '_rows', '_cols', '_next_label')
+
+    def __init__(self, cells, rows: int, cols: int, blocked: int) -> None:
+        """_summary_ labels the open cells of a grid
+
+        Args:
+            cells: one byte per cell, row-major (e.g. a Maze's bytearray)
+            rows (int): number of rows in the grid
+            cols (int): number of columns in the grid
+            blocked (int): the byte value marking a blocked cell
+        """
+        self._rows: int = rows
+        self._cols: int = cols
+        self._labels: array = array('i', [-1]) * (rows * cols)
+        self._sizes: dict[int, int] = dict()   # label -> number of cells
+        self._next_label: int = 0
+
+        # first pass: give each cell the label of the open cell above or to its left,
+        # recording in a union-find when those two labels turn out to be the same component
+        labels = self._labels
+        parent: list[int] = []
+
+        def find(label: int) -> int:
+            while parent[label] != label:
+                parent[label] = parent[parent[label]]
+                label = parent[label]
+            return label
+
+        for index in range(rows * cols):
+            if cells[index] == blocked:
+                continue
+            up   = labels[index - cols] if index >= cols else -1
+            left = labels[index - 1] if index % cols > 0 else -1
+            if up < 0 and left < 0:
+                labels[index] = len(parent)
+                parent.append(len(parent))
+            elif up < 0 or left < 0:
+                labels[index] = max(up, left)
+            else:
+                labels[index] = up
+                up, left = find(up), find(left)
+                if up != left:
+                    parent[max(up, left)] = min(up, left)
+
+        # second pass: replace each label by its union-find root, numbered from 0
+        renumbered: dict[int, int] = dict()
+        for index in range(rows * cols):
+            if labels[index] >= 0:
+                root = find(labels[index])
+                if root not in renumbered:
+                    renumbered[root] = len(renumbered)
+                label = labels[index] = renumbered[root]
+                self._sizes[label] = self._sizes.get(label, 0) + 1
+        self._next_label = len(renumbered)
+
+    def __len__(self) -> int: return len(self._sizes)
+
+    def label(self, index: int) -> int:
+        """_summary_ the component of a cell
+
+        Args:
+            index (int): row-major index of the cell
+
+        Returns:
+            int: the cell's component label, or -1 if it is blocked
+        """
+        return self._labels[index]
+
+    def size(self, index: int) -> int:
+        """_summary_ the number of cells in a cell's component
+
+        Args:
+            index (int): row-major index of the cell
+
+        Returns:
+            int: size of the cell's component, or 0 if it is blocked
+        """
+        label = self._labels[index]
+        return self._sizes[label] if label >= 0 else 0
+
+    def connected(self, first: int, second: int) -> bool:
+        """_summary_ checks whether a path of open cells joins two cells
+
+        Args:
+            first (int): row-major index of one cell
+            second (int): row-major index of the other
+
+        Returns:
+            bool: True if both cells are open and in the same component
+        """
+        label = self._labels[first]
+        return label >= 0 and label == self._labels[second]
+
+    def clear(self, index: int) -> None:
+        """_summary_ updates the labels for a blocked cell having become open (does nothing
+        if it was already open)
+
+        Args:
+            index (int): row-major index of the cell
+        """
+        if self._labels[index] >= 0:
+            return
+        neighbors = [neighbor for neighbor in gridNeighbors(index, self._rows, self._cols)
+                     if self._labels[neighbor] >= 0]
+        labels = {self._labels[neighbor] for neighbor in neighbors}
+        if not labels:
+            label = self._newLabel()
+        else:
+            # keep the largest component's label and relabel the rest into it
+            label = max(labels, key=self._sizes.__getitem__)
+            for neighbor in neighbors:
+                old = self._labels[neighbor]
+                if old != label:
+                    self._sizes[label] += self._relabel(neighbor, old, label)
+                    del self._sizes[old]
+        self._labels[index] = label
+        self._sizes[label] += 1
+
+    def block(self, index: int) -> None:
+        """_summary_ updates the labels for an open cell having become blocked (does nothing
+        if it was already blocked)
+
+        Args:
+            index (int): row-major index of the cell
+        """
+        label = self._labels[index]
+        if label < 0:
+            return
+        labels = self._labels
+        labels[index] = -1
+        self._sizes[label] -= 1
+        starts = [neighbor for neighbor in gridNeighbors(index, self._rows, self._cols) if labels[neighbor] == label]
+        if not starts:
+            del self._sizes[label]
+            return
+        if len(starts) == 1:
+            return
+
+        # one breadth-first search per open neighbor, taking turns one cell at a time;
+        # searches that meet are merged (a small union-find over the searches), and a
+        # merged group whose queues have all run dry has found a whole piece on its own
+        group = list(range(len(starts)))
+
+        def find(search: int) -> int:
+            while group[search] != search:
+                search = group[search]
+            return search
+
+        owner: dict[int, int] = {cell: search for search, cell in enumerate(starts)}
+        queues = [deque([cell]) for cell in starts]
+
+        def liveGroups() -> set[int]:
+            return {find(search) for search, queue in enumerate(queues) if queue}
+
+        while len(liveGroups()) > 1:
+            for search, queue in enumerate(queues):
+                if not queue:
+                    continue
+                cell = queue.popleft()
+                for neighbor in gridNeighbors(cell, self._rows, self._cols):
+                    if labels[neighbor] != label:
+                        continue
+                    if neighbor not in owner:
+                        owner[neighbor] = search
+                        queue.append(neighbor)
+                    else:
+                        mine, theirs = find(search), find(owner[neighbor])
+                        if mine != theirs:
+                            group[max(mine, theirs)] = min(mine, theirs)
+
+        # the one group still searching (or, if none is, the first) keeps the old label;
+        # every other group has been explored completely and gets a new one
+        live = liveGroups()
+        keep = live.pop() if live else find(0)
+        pieces: dict[int, list[int]] = dict()
+        for cell, search in owner.items():
+            root = find(search)
+            if root != keep:
+                pieces.setdefault(root, []).append(cell)
+        for cells in pieces.values():
+            new = self._newLabel()
+            for cell in cells:
+                labels[cell] = new
+            self._sizes[new] = len(cells)
+            self._sizes[label] -= len(cells)
+
+    def _newLabel(self) -> int:
+        label = self._next_label
+        self._next_label += 1
+        self._sizes[label] = 0
+        return label
+
+    def _relabel(self, start: int, old: int, new: int) -> int:
+        """_summary_ gives every cell of one component a new label
+
+        Args:
+            start (int): row-major index of a cell in the component
+            old (int): the component's current label
+            new (int): the label to give it
+
+        Returns:
+            int: the number of cells relabelled
+        """
+        labels = self._labels
+        labels[start] = new
+        queue = deque([start])
+        count = 1
+        while queue:
+            for neighbor in gridNeighbors(queue.popleft(), self._rows, self._cols):
+                if labels[neighbor] == old:
+                    labels[neighbor] = new
+                    queue.append(neighbor)
+                    count += 1
+        return count
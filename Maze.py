@@ -1,12 +1,26 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import NamedTuple
+from typing import NamedTuple, Callable, Sequence, Iterator, TextIO
+from array import array
+from collections import deque
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import mmap
+import os
 import random
+import struct
+import sys
+import threading
+import time
 
 from Stack import *
 from Queue import *  
 from PriorityQueue import *
+from Wavefront import wavefrontDistances, descendPath
+from Components import ComponentLabels
+from Sampling import blockRandomCells, writeRandomBits
+from Tiles import TiledCells
 
 ################################################################################
 class Contents(str, Enum):
@@ -36,11 +50,36 @@ class Position(NamedTuple):
 
 ################################################################################
 class SearchOrder(Enum):
-    ''' enumeration for neighboring cells search order '''
+    ''' enumeration for neighboring cells search order; the orders ending
+        in 8 also move diagonally (see Maze) '''
     NSWE   = 1
     NESW   = 2
     RANDOM = 3
     SEWN = 4
+    NESW8   = 5
+    NSWE8   = 6
+    RANDOM8 = 7
+
+# (row,col) offsets of the neighbors of a cell, in each SearchOrder
+# (RANDOM starts from N/S/W/E and RANDOM8 from NSWE8, and both are shuffled
+# for every cell explored)
+_DIRECTIONS: dict[SearchOrder, list[tuple[int, int]]] = {
+    SearchOrder.NSWE:    [(-1, 0), (1, 0), (0, -1), (0, 1)],
+    SearchOrder.NESW:    [(-1, 0), (0, 1), (1, 0), (0, -1)],
+    SearchOrder.SEWN:    [(1, 0), (0, 1), (0, -1), (-1, 0)],
+    SearchOrder.RANDOM:  [(-1, 0), (1, 0), (0, -1), (0, 1)],
+    SearchOrder.NESW8:   [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)],
+    SearchOrder.NSWE8:   [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)],
+    SearchOrder.RANDOM8: [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)],
+}
+_SHUFFLED:  frozenset[SearchOrder] = frozenset({SearchOrder.RANDOM, SearchOrder.RANDOM8})
+_EIGHT_WAY: frozenset[SearchOrder] = frozenset(order for order in SearchOrder if len(_DIRECTIONS[order]) == 8)
+
+# with diagonal moves, A* and Dijkstra charge 10 for a straight move and 14
+# (about 10 * sqrt(2)) for a diagonal one, times the cost of the cell entered,
+# so that path costs stay ints
+_STRAIGHT_COST: int = 10
+_DIAGONAL_COST: int = 14
 ################################################################################
 class Cell:
     ''' class that allows us to use Cell as a data type -- an ordered triple 
@@ -129,17 +168,375 @@ class Cell:
                self._position.col == other._position.col and \
                self._contents == other._contents
 
+################################################################################
+# each Contents value gets a one-byte code (its position in the enumeration),
+# which is what a Maze stores per cell in its flat row-major bytearray
+_CONTENTS: list[Contents] = list(Contents)
+_CODE:     dict[Contents, int] = {contents: code for code, contents in enumerate(_CONTENTS)}
+_BLOCKED:  int = _CODE[Contents.BLOCKED]
+
+# turns a row of codes (decoded one character per byte) into the symbols
+# __str__ shows, each followed by the pipe after it
+_RENDER: dict[int, str] = str.maketrans({chr(code): f"{contents.value}|" for code, contents in enumerate(_CONTENTS)})
+
+# a Maze file (see Maze.save) starts with a header -- the magic bytes, the
+# format version, how the grid is stored, then rows, cols, start row and col
+# and goal row and col as little-endian unsigned 32-bit ints -- followed by
+# the grid, either one byte per cell as a Maze stores it or one bit per cell
+# (set if blocked), row-major, most significant bit first
+_FILE_HEADER:  struct.Struct = struct.Struct('<4sBB6I')
+_FILE_MAGIC:   bytes = b'MAZE'
+_FILE_VERSION: int = 1
+_BYTE_GRID:    int = 0
+_BIT_GRID:     int = 1
+
+# lookup tables for packing and unpacking bit grids 8 cells at a time
+_BLOCKED_FLAG: bytes = bytes(1 if code == _BLOCKED else 0 for code in range(256))
+_PACKED:   dict[bytes, int] = {bytes(bits >> (7 - i) & 1 for i in range(8)): bits for bits in range(256)}
+_UNPACKED: list[bytes] = [bytes(_BLOCKED if bits >> (7 - i) & 1 else _CODE[Contents.EMPTY] for i in range(8))
+                          for bits in range(256)]
+
+def _countBlocked(cells: bytearray | memoryview | TiledCells) -> int:
+    if isinstance(cells, TiledCells):
+        return cells.countBlocked()
+    # a memoryview of a mapped file has no count, and copying it whole would
+    # take as much memory as the grid, so it is counted a megabyte at a time
+    return sum(bytes(cells[at : at + (1 << 20)]).count(_BLOCKED) for at in range(0, len(cells), 1 << 20))
+
+def _packBlocked(cells: bytearray) -> bytes:
+    flags = bytes(cells).translate(_BLOCKED_FLAG)
+    flags += bytes(-len(flags) % 8)
+    return bytes(map(_PACKED.__getitem__, (flags[i : i + 8] for i in range(0, len(flags), 8))))
+
+def _unpackBlocked(packed: bytes, size: int) -> bytearray:
+    cells = bytearray(b''.join(map(_UNPACKED.__getitem__, packed)))
+    del cells[size:]
+    return cells
+
+################################################################################
+class SearchResult:
+    ''' class holding everything one search of a Maze produces -- the parent of
+        each reached cell, the number of cells explored, and the resulting path
+        -- so that searching never modifies the Maze itself
+    '''
+    __slots__ = ('_maze', '_parents', '_num_cells_explored', '_path')
+
+    def __init__(self, maze: Maze, parents: array, num_cells_explored: int, goal: int | None):
+        ''' initializer method for a SearchResult object
+        Parameters:
+            maze:               the Maze that was searched
+            parents:            array (or dict) holding, per cell index
+                                (row * cols + col), the index of the cell it
+                                was reached from, or -1
+            num_cells_explored: number of cells the search added to its frontier
+            goal:               index of the goal cell, or None if it was not reached
+        '''
+        self._maze:               Maze      = maze
+        self._parents:            array     = parents
+        self._num_cells_explored: int       = num_cells_explored
+        self._path:               list[int] = []   # cell indices, start to goal
+
+        if goal is not None:
+            index = goal
+            while index >= 0:
+                self._path.append(index)
+                index = parents[index]
+            self._path.reverse()
+
+    def isFound(self) -> bool:
+        ''' Boolean method to indicate whether the search reached the goal
+        Returns:
+            True if a path from start to goal was found, False o/w
+        '''
+        return len(self._path) > 0
+
+    def getNumCellsExplored(self) -> int:
+        ''' accessor method to return how many cells the search explored
+        Returns:
+            the number of cells added to the search frontier
+        '''
+        return self._num_cells_explored
+
+    def getPathLength(self) -> int:
+        ''' accessor method to return the number of steps from start to goal
+        Returns:
+            the path length, or 0 if the goal was not reached
+        '''
+        return max(len(self._path) - 1, 0)
+
+    def getPathCost(self) -> int:
+        ''' method to return the total cost of the moves along the path, each
+            costing what it costs to enter its cell (see Maze.setCosts),
+            times 10 for a straight move or 14 for a diagonal one when the
+            Maze moves diagonally
+        Returns:
+            the path cost (the path length when the Maze has no costs and no
+            diagonal moves), or 0 if the goal was not reached
+        '''
+        maze = self._maze
+        costs = maze._costs
+        if maze._search_order not in _EIGHT_WAY:
+            if costs is None:
+                return self.getPathLength()
+            return sum(costs[index] for index in self._path[1:])
+        cols = maze._num_cols
+        # a move is straight if it stays in its row or column (comparing the
+        # index difference with 1 and cols fails when cols is 2)
+        return sum((_STRAIGHT_COST if previous // cols == index // cols or previous % cols == index % cols
+                    else _DIAGONAL_COST) *
+                   (1 if costs is None else costs[index])
+                   for previous, index in zip(self._path, self._path[1:]))
+
+    def getPath(self) -> list[Position]:
+        ''' accessor method to return the cells on the path that was found
+        Returns:
+            a list of Position objects running from start to goal (empty if
+            the goal was not reached)
+        '''
+        cols = self._maze._num_cols
+        return [Position(*divmod(index, cols)) for index in self._path]
+
+    def getGoal(self) -> Cell | None:
+        ''' method to return the path as a chain of new Cell objects, linked
+            via .setParent from the goal back to the start (the Maze's own
+            cells are left untouched)
+        Returns:
+            the goal Cell at the end of the chain, or None if the goal was not
+            reached
+        '''
+        cell = None
+        for position in self.getPath():
+            contents = _CONTENTS[self._maze._cells[self._maze._index(position)]]
+            next_cell = Cell(position.row, position.col, contents)
+            if cell is not None:
+                next_cell.setParent(cell)
+            cell = next_cell
+        return cell
+
+    def __str__(self) -> str:
+        ''' creates and returns a string summary of this result
+        Returns:
+            a string giving the path length and number of cells explored
+        '''
+        if not self.isFound():
+            return f"goal not attainable, cells explored = {self._num_cells_explored}"
+        return f"cells explored = {self._num_cells_explored} and path length = {self.getPathLength()}"
+
+################################################################################
+class SearchEvent(Enum):
+    ''' enumeration for the kinds of step the generator versions of the
+        searches (Maze.dfsSteps, Maze.bfsSteps, Maze.aStarSteps) yield; each
+        step is a tuple of one of these and a cell index (row * cols + col),
+        except FINISHED, which comes with the SearchResult
+    '''
+    EXPANDED = 1   # a cell was taken off the frontier to look at its neighbors
+    PUSHED   = 2   # a cell was added to the frontier (only if asked for)
+    FOUND    = 3   # the goal was taken off the frontier
+    FINISHED = 4   # the search is over, whether or not the goal was found
+
+SearchStep = tuple[SearchEvent, "int | SearchResult"]
+
+def _finalResult(steps: Iterator[SearchStep]) -> SearchResult:
+    ''' runs the generator version of a search to the end
+    Parameters:
+        steps: the steps of a search
+    Returns:
+        the SearchResult carried by the last, FINISHED, step
+    '''
+    # a deque that keeps only the last item consumes the steps without
+    # running any Python code per step
+    return deque(steps, maxlen=1)[0][1]
+
+################################################################################
+class SearchMetrics(NamedTuple):
+    ''' the numbers recorded for one instrumented search (see SearchStats);
+        times are in seconds, container_bytes in bytes
+    '''
+    algorithm:     str
+    found:         bool
+    setup_time:    float   # allocating the visited/parent structures
+    search_time:   float   # the search loop itself
+    path_time:     float   # building the SearchResult (following parents back)
+    expansions:    int     # cells taken off the frontier
+    pushes:        int     # cells added to (or re-keyed on) the frontier, the start included
+    stale_pops:    int     # entries taken off the frontier after a cheaper one
+    peak_frontier: int     # most entries on the frontier at once
+    container_bytes: int   # sys.getsizeof of the visited/cost and parent containers, not
+                           # the objects they hold (for the whole footprint, use tracemalloc)
+
+    @property
+    def wall_time(self) -> float: return self.setup_time + self.search_time + self.path_time
+
+################################################################################
+class SearchStats:
+    ''' class that collects the SearchMetrics of every search it is passed to
+        (via the stats parameter of Maze.dfs, bfs, aStar, dijkstra and
+        idaStar, and of the dfsSteps, bfsSteps and aStarSteps generators;
+        bidirectionalBfs and fieldPath take none), keeping running totals --
+        and the maxima of the peak frontier and container sizes -- so that
+        any number of searches can be aggregated; an optional callback also
+        receives each search's SearchMetrics as it is recorded
+    '''
+    __slots__ = ('searches', 'found', 'wall_time', 'phase_times', 'expansions', 'pushes', \
+                 'stale_pops', 'peak_frontier', 'container_bytes', '_callback')
+
+    def __init__(self, callback: Callable[[SearchMetrics], None] = None):
+        ''' initializer method for a SearchStats object
+        Parameters:
+            callback: optional function called with the SearchMetrics of
+                      each search recorded
+        '''
+        self.searches:      int   = 0
+        self.found:         int   = 0
+        self.wall_time:     float = 0.0
+        self.phase_times:   dict[str, float] = {"setup": 0.0, "search": 0.0, "path": 0.0}
+        self.expansions:    int   = 0
+        self.pushes:        int   = 0
+        self.stale_pops:    int   = 0
+        self.peak_frontier: int   = 0
+        self.container_bytes: int = 0
+        self._callback = callback
+
+    def record(self, metrics: SearchMetrics) -> None:
+        ''' method to add one search's numbers to the totals
+        Parameters:
+            metrics: the SearchMetrics of a finished search
+        '''
+        self.searches   += 1
+        self.found      += metrics.found
+        self.wall_time  += metrics.wall_time
+        self.phase_times["setup"]  += metrics.setup_time
+        self.phase_times["search"] += metrics.search_time
+        self.phase_times["path"]   += metrics.path_time
+        self.expansions += metrics.expansions
+        self.pushes     += metrics.pushes
+        self.stale_pops += metrics.stale_pops
+        self.peak_frontier = max(self.peak_frontier, metrics.peak_frontier)
+        self.container_bytes = max(self.container_bytes, metrics.container_bytes)
+        if self._callback is not None:
+            self._callback(metrics)
+
+    def __str__(self) -> str:
+        ''' creates and returns a string summary of the totals
+        Returns:
+            a string giving the totals over all searches recorded
+        '''
+        phases = ", ".join(f"{phase} {seconds:.6f}s" for phase, seconds in self.phase_times.items())
+        return f"{self.searches} searches ({self.found} found) in {self.wall_time:.6f}s ({phases}): " \
+               f"{self.expansions} expansions, {self.pushes} pushes, {self.stale_pops} stale pops, " \
+               f"peak frontier {self.peak_frontier}, largest containers {self.container_bytes} bytes"
+
+################################################################################
+class QueryResult(NamedTuple):
+    ''' the outcome of one (start, goal) query of Maze.solveMany '''
+    start:              Position
+    goal:               Position
+    found:              bool
+    path_length:        int
+    num_cells_explored: int
+    path:               list[Position]   # start to goal, empty if not found
+
+################################################################################
+class _TrackedStack(Stack):
+    ''' a Stack that also remembers the most elements it has held at once '''
+    __slots__ = ('peak',)
+
+    def __init__(self):
+        super().__init__()
+        self.peak: int = 0
+
+    def push(self, element) -> None:
+        super().push(element)
+        if len(self._data) > self.peak: self.peak = len(self._data)
+
+class _TrackedQueue(Queue):
+    ''' a Queue that also remembers the most elements it has held at once '''
+    __slots__ = ('peak',)
+
+    def __init__(self):
+        super().__init__()
+        self.peak: int = 0
+
+    def push(self, element) -> None:
+        super().push(element)
+        if len(self._data) > self.peak: self.peak = len(self._data)
+
+################################################################################
+class _CellIndices(Sequence):
+    ''' the row-major indices of every cell of a grid but a few excluded ones
+        (the start and goal), in order, without making a list of them:
+        random.sample only takes the length of what it samples from and
+        indexes it, or copies it to a list, which chaining ranges makes quick
+    '''
+    __slots__ = ('_size', '_excluded')
+
+    def __init__(self, size: int, excluded: tuple[int, ...]):
+        self._size:     int       = size
+        self._excluded: list[int] = sorted(set(excluded))
+
+    def __len__(self) -> int: return self._size - len(self._excluded)
+
+    def __getitem__(self, position: int) -> int:
+        if position < 0 or position >= len(self):
+            raise IndexError("cell index out of range")
+        for index in self._excluded:
+            if position >= index:
+                position += 1
+        return position
+
+    def __iter__(self) -> Iterator[int]:
+        bounds = [-1] + self._excluded + [self._size]
+        return chain.from_iterable(range(low + 1, high) for low, high in zip(bounds, bounds[1:]))
+
+################################################################################
+class _SparseTable(dict):
+    ''' per-cell table for the searches of a tiled Maze, which would not fit
+        one entry for every cell: holds only the entries that are set, and
+        reads as the fill value for every other cell
+    '''
+    __slots__ = ('_fill',)
+
+    def __init__(self, fill: int | None):
+        super().__init__()
+        self._fill: int | None = fill
+
+    def __missing__(self, index: int) -> int | None: return self._fill
+
+# how many goals' distance fields (see Maze.distanceField) a Maze keeps at once
+_DISTANCE_FIELDS_KEPT: int = 8
+
+# grids with more cells than this work neighbors out per cell rather than
+# building neighbor tables on first search (see Maze._neighborLookup): the
+# tables take about 20 bytes a cell and several times one search to build
+_ADJACENCY_MAX_CELLS: int = 1 << 18
+
+# slots in the transposition table idaStar keeps by default (1MB); without
+# one, or with far fewer slots than the open cells a search reaches, IDA* may
+# take exponentially long, above all when the goal is walled off
+_IDA_TABLE_SIZE: int = 1 << 16
+
 ################################################################################
 class Maze:
-    ''' class representing a 2D maze of Cell objects '''
-    __slots__ = ('_grid', '_num_rows', '_num_cols', '_start', '_goal', '_search_order', '_num_cells_explored', '_path_length')
+    ''' class representing a 2D maze of Cell objects; the contents of every
+        cell are kept one byte per cell in a flat row-major bytearray (or, for
+        a Maze loaded from a file, a memoryview of the mapped file, or for one
+        too big for memory, TiledCells reading one bit per cell from the
+        file), and a compact Maze keeps only those, creating Cell objects on
+        demand
+    '''
+    __slots__ = ('_grid', '_cells', '_num_rows', '_num_cols', '_start', '_goal', '_search_order', '_adjacency', '_rng', \
+                 '_components', '_distance_fields', '_fields_lock', '_costs', '_min_cost')
  
     def __init__(self, rows: int = 10, cols: int = 10,
                        start:        Position = None, \
                        goal:         Position = None, \
                        prop_blocked: float = 0.1, \
                        search_order: SearchOrder = SearchOrder.NESW, \
-                       debug: bool = False):
+                       debug: bool = False, \
+                       compact: bool = False, \
+                       rng: random.Random = None, \
+                       components: bool = False, \
+                       fast_generation: bool = False):
         ''' initializer method for a Maze object
         Parameters:
             rows:          number of rows in the grid
@@ -147,12 +544,29 @@ class Maze:
             start:         Position object indicating the (row,col) of the start cell
             goal:          Position object indicating the (row,col) of the goal cell
             prop_blocked:  proportion of cells to be blocked (between 0.0 and 1.0)
+            search_order:  SearchOrder in which the searches look at the
+                           neighbors of a cell; with NESW8, NSWE8 or RANDOM8
+                           a move may also go diagonally, if both cells it
+                           passes between are open (no cutting corners)
             debug:         whether to use one of the Maze examples from course slides
+            compact:       whether to skip building the 2D list of Cell objects
+                           and store only one byte per cell
+            rng:           random.Random used to place blocks and to shuffle
+                           SearchOrder.RANDOM (the shared random module if not
+                           given), so separately seeded mazes never share state
+            components:    whether to label the connected regions of open cells
+                           right away (see isReachable), so that every search
+                           returns at once when the goal cannot be reached
+            fast_generation: whether to pick the blocked cells with numpy
+                           (seeded from rng), which is much quicker for big
+                           mazes but does not block the same cells a given
+                           seed blocks otherwise
         Raises:
             TypeError  if prop_blocked is not a float
             ValueError if prop_blocked is not in (0,1)
             TypeError  if start or goal is not a Position object
             ValueError if row/col of start or goal is out of range
+            ImportError if fast_generation is used without numpy installed
         '''
         msg = "prop_blocked must be a float between 0 and 1"
         try:
@@ -190,46 +604,312 @@ class Maze:
         self._start        = Cell(start.row, start.col, Contents.START)
         self._goal         = Cell(goal.row,  goal.col,  Contents.GOAL)
         self._search_order = search_order
-        self._num_cells_explored = 0
-        self._path_length = 0
-        
-        # create a rows x cols 2D list of Cell objects, intially all empty
-        self._grid: list[list[Cell]] = \
-            [ [Cell(r,c, Contents.EMPTY) for c in range(cols)] for r in range(rows) ]
+        self._rng          = random if rng is None else rng
+        # neighbor tables per SearchOrder, built when first searched
+        self._adjacency: dict[SearchOrder, tuple[array, array]] = {}
 
-        # set the start and goal cells (overriding two empty Cell objects from above)
-        self._grid[start.row][start.col] = self._start
-        self._grid[goal.row][goal.col]   = self._goal
+        # one byte per cell, row-major, intially all empty
+        self._cells: bytearray = bytearray(rows * cols)
+        start_index = self._index(start)
+        goal_index  = self._index(goal)
 
         # put blocks at random spots in the grid, using given proportion;  
-        # start by creating a collapsed 1D version of the grid, then
-        #   remove the start and goal, and then randomly pick cells to block;
-        # note that we are using identical object references in both 
-        #   options and self._grid so that updates to options will be seen
-        #   in self._grid (i.e., options is not a deep copy of cells);
-        if not debug: 
-            options = [cell for row in self._grid for cell in row]
-            options.remove(self._start)
-            options.remove(self._goal)
-            blocked = random.sample(options, k = round((rows * cols - 2) * prop_blocked))
-            for b in blocked: 
-                b._contents = Contents.BLOCKED  # this is changing self._grid!
-        else:
+        # randomly pick cells to block from the 1D sequence of cell indices
+        #   that leaves out the start and goal;
+        # random.sample only looks at the length of what it samples from, so
+        #   picking from these indices blocks the same cells that picking
+        #   from a flattened list of the Cell objects would
+        num_blocked = round((rows * cols - 2) * prop_blocked)
+        if debug:
             # for example from slides
             pos = [(1,0),(1,3),(2,1),(2,4),(3,2),(5,1),(5,3),(5,4)]
-            for p in pos:
-                self._grid[p[0]][p[1]]._contents = Contents.BLOCKED
+            blocked = [p[0] * cols + p[1] for p in pos]
+        elif fast_generation:
+            blockRandomCells(self._cells, tuple({start_index, goal_index}), num_blocked, _BLOCKED,
+                             self._rng.getrandbits(64))
+            blocked = []
+        else:
+            blocked = self._rng.sample(_CellIndices(rows * cols, (start_index, goal_index)), k = num_blocked)
+        for b in blocked:
+            self._cells[b] = _BLOCKED
+        self._cells[start_index] = _CODE[Contents.START]
+        self._cells[goal_index]  = _CODE[Contents.GOAL]
+
+        # unless compact, also create a rows x cols 2D list of Cell objects
+        # matching the bytes above
+        self._grid: list[list[Cell]] | None = None
+        if not compact:
+            self._buildGrid()
+
+        # connected-component labels of the open cells, kept up to date by
+        # setBlocked once built
+        self._components: ComponentLabels | None = None
+        if components:
+            self._components = ComponentLabels(self._cells, rows, cols, _BLOCKED)
+        # per goal cell index, the steps from every cell to it (see
+        # distanceField), most recently used last; dropped by setBlocked
+        self._distance_fields: dict[int, array] = {}
+        # guards the cache, which solveMany's worker threads share
+        self._fields_lock: threading.Lock = threading.Lock()
+        # the cost of moving into each cell (see setCosts), None while every
+        # move costs 1, and the least cost, which scales the A* heuristic
+        self._costs: array | None = None
+        self._min_cost: int = 1
+
+    def __getstate__(self) -> dict:
+        ''' method used by pickle (e.g. to hand a Maze to worker processes);
+            the neighbor tables are left to be rebuilt, the distance fields'
+            lock is left to be made anew, and the shared random module, which
+            cannot be pickled, is recorded as None
+        Returns:
+            a dict of the Maze's attributes
+        '''
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state['_adjacency'] = {}
+        del state['_fields_lock']
+        if isinstance(state['_cells'], memoryview):
+            # a loaded Maze's memory-mapped cells are copied out (tiled
+            # cells map their file again instead)
+            state['_cells'] = bytearray(state['_cells'])
+        if state['_rng'] is random:
+            state['_rng'] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        ''' method used by pickle to restore a Maze from __getstate__
+        Parameters:
+            state: the dict __getstate__ returned
+        '''
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._fields_lock = threading.Lock()
+        if self._rng is None:
+            self._rng = random
+
+    def _buildGrid(self) -> None:
+        ''' method to create the rows x cols 2D list of Cell objects matching
+            the bytes of the Maze, sharing the start and goal Cell objects
+        '''
+        cols = self._num_cols
+        self._grid = \
+            [ [Cell(r,c, _CONTENTS[self._cells[r * cols + c]]) for c in range(cols)] for r in range(self._num_rows) ]
+        start, goal = self._start._position, self._goal._position
+        self._grid[start.row][start.col] = self._start
+        self._grid[goal.row][goal.col]   = self._goal
+
+    def save(self, path: str, packed: bool = False) -> None:
+        ''' method to write the Maze to a binary file that Maze.load reads
+            back, so the same maze can be used again without regenerating it
+        Parameters:
+            path:   name of the file to write
+            packed: whether to store one bit per cell (whether it is blocked)
+                    rather than one byte, for a file an eighth of the size;
+                    any path marked by showPath is then not kept, and loading
+                    has to unpack the grid rather than map it
+        Raises:
+            OSError    if the file cannot be written
+            ValueError if the Maze is tiled (its file is already saved)
+        '''
+        if isinstance(self._cells, TiledCells):
+            raise ValueError("a tiled Maze cannot be saved")
+        start, goal = self._start._position, self._goal._position
+        header = _FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, _BIT_GRID if packed else _BYTE_GRID,
+                                   self._num_rows, self._num_cols, start.row, start.col, goal.row, goal.col)
+        with open(path, 'wb') as f:
+            f.write(header)
+            f.write(_packBlocked(self._cells) if packed else self._cells)
+
+    @classmethod
+    def load(cls, path: str, search_order: SearchOrder = SearchOrder.NESW, \
+                             compact: bool = False, \
+                             rng: random.Random = None, \
+                             components: bool = False, \
+                             tiled: bool = False, \
+                             tile_size: int = 256, \
+                             cache_bytes: int = 64 << 20) -> Maze:
+        ''' method to create a Maze from a file written by save (or
+            generateFile); a file storing a byte per cell is memory-mapped
+            copy-on-write rather than read, so even a huge maze opens at once
+            and its cells are only read from disk as they are used (changes
+            made with setBlocked stay in memory and never reach the file)
+        Parameters:
+            path:         name of the file to read
+            search_order, compact, rng, components: as for the initializer
+            tiled:        whether to keep the grid in the file, reading it
+                          in square tiles as the cells are used and keeping
+                          only the most recently used tiles in memory (see
+                          Tiles.py), for a maze too big to load; the file
+                          must store a bit per cell, and the Maze is compact
+                          whatever compact says; searches then keep their
+                          bookkeeping per cell reached rather than per cell
+                          of the grid, and vectorized bfs, save and the
+                          component labels (components, isReachable) are not
+                          available, since each needs memory for every cell
+            tile_size:    side length of a tile in cells (a power of two)
+            cache_bytes:  memory the tiles kept may take up
+        Returns:
+            the Maze stored in the file
+        Raises:
+            OSError    if the file cannot be read
+            ValueError if the file is not a Maze file, was written by a
+                       newer version, or is cut short
+            ValueError if tiled is asked for a file storing a byte per cell,
+                       or with components, or tile_size is not a power of
+                       two of at least 8
+        '''
+        with open(path, 'rb') as f:
+            header = f.read(_FILE_HEADER.size)
+            if len(header) < _FILE_HEADER.size or header[:len(_FILE_MAGIC)] != _FILE_MAGIC:
+                raise ValueError(f"{path} is not a Maze file")
+            _, version, grid, rows, cols, start_row, start_col, goal_row, goal_col = _FILE_HEADER.unpack(header)
+            if version != _FILE_VERSION or grid not in (_BYTE_GRID, _BIT_GRID):
+                raise ValueError(f"{path} has an unsupported Maze file version")
+            if rows < 1 or cols < 1 or start_row >= rows or start_col >= cols or goal_row >= rows or goal_col >= cols:
+                raise ValueError(f"{path} has an invalid Maze header")
+            size = rows * cols
+            stored = size if grid == _BYTE_GRID else (size + 7) // 8
+            if os.fstat(f.fileno()).st_size < _FILE_HEADER.size + stored:
+                raise ValueError(f"{path} is cut short")
+            if tiled:
+                if grid != _BIT_GRID:
+                    raise ValueError(f"{path} stores a byte per cell, so it cannot be tiled")
+                if components:
+                    raise ValueError("component labels need a label per cell, so a tiled Maze cannot have them")
+                cells = TiledCells(path, _FILE_HEADER.size, rows, cols, _BLOCKED, _CODE[Contents.EMPTY],
+                                   tile_size, cache_bytes)
+                compact = True
+            elif grid == _BYTE_GRID:
+                mapped = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_COPY)
+                cells = memoryview(mapped)[_FILE_HEADER.size : _FILE_HEADER.size + size]
+            else:
+                cells = _unpackBlocked(f.read(stored), size)
+            if grid == _BIT_GRID:
+                cells[start_row * cols + start_col] = _CODE[Contents.START]
+                cells[goal_row * cols + goal_col]   = _CODE[Contents.GOAL]
+
+        maze = cls.__new__(cls)
+        maze.__setstate__({'_grid': None, '_cells': cells, '_num_rows': rows, '_num_cols': cols,
+                           '_start': Cell(start_row, start_col, Contents.START),
+                           '_goal': Cell(goal_row, goal_col, Contents.GOAL),
+                           '_search_order': search_order, '_adjacency': {}, '_rng': rng,
+                           '_components': None, '_distance_fields': {}, '_costs': None, '_min_cost': 1})
+        if not compact:
+            maze._buildGrid()
+        if components:
+            maze._components = ComponentLabels(cells, rows, cols, _BLOCKED)
+        return maze
+
+    @staticmethod
+    def generateFile(path: str, rows: int, cols: int, start: Position = None, \
+                                                      goal: Position = None, \
+                                                      prop_blocked: float = 0.1, \
+                                                      seed: int = None) -> None:
+        ''' method to write a random maze straight to a file storing a bit per
+            cell, a chunk of cells at a time, so that mazes too big to build
+            in memory can be made (and then loaded tiled, see load); each
+            cell other than the start and goal is blocked independently with
+            probability prop_blocked, rather than exactly that proportion
+            being blocked as in the initializer
+        Parameters:
+            path:         name of the file to write
+            rows, cols, start, goal, prop_blocked: as for the initializer
+            seed:         seed for the random cells (taken from the random
+                          module if not given)
+        Raises:
+            ValueError  if prop_blocked is not in (0,1), or row/col of
+                        start or goal is out of range
+            OSError     if the file cannot be written
+            ImportError if numpy is not installed
+        '''
+        if prop_blocked < 0 or prop_blocked > 1:
+            raise ValueError("prop_blocked must be a float between 0 and 1")
+        if start is None or goal is None:
+            start = Position(0,0)
+            goal  = Position(rows - 1, cols - 1)
+        for position in (start, goal):
+            if position.row < 0 or position.row >= rows or position.col < 0 or position.col >= cols:
+                raise ValueError("invalid (row,col) given for start or goal cell")
+        if seed is None:
+            seed = random.getrandbits(64)
+        with open(path, 'w+b') as f:
+            f.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, _BIT_GRID, rows, cols,
+                                      start.row, start.col, goal.row, goal.col))
+            writeRandomBits(f, rows * cols, prop_blocked, seed)
+            # the start and goal are never blocked
+            for position in (start, goal):
+                index = position.row * cols + position.col
+                f.seek(_FILE_HEADER.size + (index >> 3))
+                byte = f.read(1)[0] & ~(0x80 >> (index & 7))
+                f.seek(-1, os.SEEK_CUR)
+                f.write(bytes([byte]))
 
     def __str__(self) -> str:
         ''' creates a str version of the Maze, showing contents, with cells
-            delimited by vertical pipes 
+            delimited by vertical pipes (see render to write it out a row at
+            a time instead)
         Returns:
             a str representation of the Maze
         '''
-        maze_str = ""
-        for row in self._grid:  # row : list[Cell] 
-            maze_str += "|" + "|".join([cell._contents for cell in row]) + "|\n"
-        return maze_str[:-1]  # remove the final \n
+        return "\n".join(self._renderRows())
+
+    def render(self, file: TextIO = None, path: SearchResult | Sequence[Position] = None, \
+                     margin: int = None) -> None:
+        ''' method to write the Maze out as __str__ shows it, one row at a
+            time, so that memory use does not grow with the size of the Maze,
+            optionally drawing a path over it without changing any cell
+        Parameters:
+            file:   text stream to write to (sys.stdout if not given)
+            path:   a SearchResult, or the Positions along a path, to show
+                    with Contents.PATH (the start and goal keep their own)
+            margin: if given, only the cells within this many rows and
+                    columns of the path (or, with no path, of the start and
+                    goal) are written
+        '''
+        if file is None:
+            file = sys.stdout
+        for line in self._renderRows(path, margin):
+            file.write(line)
+            file.write("\n")
+
+    def _renderRows(self, path: SearchResult | Sequence[Position] = None, \
+                          margin: int = None) -> Iterator[str]:
+        ''' generator doing the work of render and __str__
+        Parameters:
+            path, margin: as for render
+        Returns:
+            an iterator of the rows of the picture, without newlines
+        '''
+        rows, cols = self._num_rows, self._num_cols
+        if isinstance(path, SearchResult):
+            indices = path._path
+        else:
+            indices = [position.row * cols + position.col for position in path or ()]
+        start, goal = self._endpoints()
+
+        # the columns drawn on the path, per row
+        on_path: dict[int, list[int]] = {}
+        for index in indices:
+            if index != start and index != goal:
+                row, col = divmod(index, cols)
+                on_path.setdefault(row, []).append(col)
+
+        first_row, last_row, first_col, last_col = 0, rows - 1, 0, cols - 1
+        if margin is not None:
+            around = [divmod(index, cols) for index in (indices or (start, goal))]
+            first_row = max(min(row for row, _ in around) - margin, 0)
+            last_row  = min(max(row for row, _ in around) + margin, rows - 1)
+            first_col = max(min(col for _, col in around) - margin, 0)
+            last_col  = min(max(col for _, col in around) + margin, cols - 1)
+
+        path_code = _CODE[Contents.PATH]
+        for row in range(first_row, last_row + 1):
+            codes = bytes(self._cells[row * cols + first_col : row * cols + last_col + 1])
+            if row in on_path:
+                codes = bytearray(codes)
+                for col in on_path[row]:
+                    if first_col <= col <= last_col:
+                        codes[col - first_col] = path_code
+            yield "|" + codes.decode('latin-1').translate(_RENDER)
 
     def getStart(self) -> Cell: 
         ''' accessor method to return the Cell object corresponding to the Maze start
@@ -245,186 +925,1415 @@ class Maze:
         '''
         return self._goal
 
+    def getCell(self, position: Position) -> Cell:
+        ''' accessor method to return the Cell object at a given location; a
+            compact Maze has no grid of Cell objects, so it creates a new Cell
+            on every call (other than for the start and goal)
+        Parameters:
+            position: Position object indicating the (row,col) of the cell
+        Returns:
+            the Cell object at that location
+        Raises:
+            ValueError if row/col of position is out of range
+        '''
+        if position.row < 0 or position.row >= self._num_rows or \
+           position.col < 0 or position.col >= self._num_cols:
+            raise ValueError("invalid (row,col) given for cell")
+        if self._grid is not None:
+            return self._grid[position.row][position.col]
+        if position == self._start._position: return self._start
+        if position == self._goal._position:  return self._goal
+        return Cell(position.row, position.col, _CONTENTS[self._cells[self._index(position)]])
+
+    def _searchDirections(self) -> list[tuple[int, int]]:
+        ''' method to return the (row,col) offsets of the neighbors of a
+            cell, in the order given by this Maze's SearchOrder (shuffled anew
+            on each call for SearchOrder.RANDOM and RANDOM8)
+        Returns:
+            a list of four (or, moving diagonally, eight) (row offset, col
+            offset) tuples
+        '''
+        searchDirections = _DIRECTIONS[self._search_order]
+        if self._search_order in _SHUFFLED:
+            searchDirections = list(searchDirections)
+            self._rng.shuffle(searchDirections)
+        return searchDirections
+
     def getSearchLocations(self, cell: Cell) -> list[Cell]:
         ''' method to return a list of Cell objects of valid places to explore
-            (i.e., not blocked and within the grid)
+            (i.e., not blocked and within the grid), the four straight
+            neighbors or, for the orders ending in 8 (NESW8, NSWE8, RANDOM8),
+            the diagonal ones as well; a diagonal neighbor is left out if
+            either cell beside both it and this one is blocked, so that a move
+            never cuts the corner of a blocked cell
         Parameters:
             cell:  the current Cell being explored
-            order: SearchOrder enum -- one of NSWE, NESW, or RANDOM
         Returns:
-            a list of valid Cell objects (in N/S/W/E exploration) for further
-            consideration
+            a list of valid Cell objects, in the order given by this Maze's
+            SearchOrder (shuffled anew on each call for RANDOM and RANDOM8),
+            for further consideration
+        '''
+        neighbors = self._neighborLookup()(self._index(cell.getPosition()))
+        return [self.getCell(Position(*divmod(n, self._num_cols))) for n in neighbors]
+
+    def _openNeighbors(self, index: int) -> list[int]:
+        ''' index-based version of getSearchLocations used by the searches, so
+            that no Cell or Position objects are created while exploring
+        Parameters:
+            index: row * cols + col of the current cell being explored
+        Returns:
+            a list of the indices of the valid neighbors, in search order
         '''
         validNeigh = []
-        if self._search_order == SearchOrder.NSWE:
-            searchDirections =  [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        elif self._search_order == SearchOrder.NESW:
-            searchDirections =  [(-1, 0),(0, 1), (1, 0), (0, -1)]
-        elif self._search_order == SearchOrder.SEWN:
-            searchDirections = [(1, 0), (0, 1), (0, -1), (-1, 0)]
-        elif self._search_order == SearchOrder.RANDOM:
-            searchDirections = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-            random.shuffle(searchDirections)  
-        
-         
-        currentRow, currentCol = cell.getPosition()
-        for nextRow, nextCol in searchDirections:
+        cols = self._num_cols
+        cells = self._cells
+        currentRow, currentCol = divmod(index, cols)
+        for nextRow, nextCol in self._searchDirections():
             newRow = currentRow + nextRow
             newCol = currentCol + nextCol
-            if newRow >= 0 and newRow < self._num_rows and newCol >= 0 and newCol < self._num_cols:
-                neighCell = self._grid[newRow][newCol]
-                if not neighCell.isBlocked():
-                    validNeigh.append(neighCell)
+            if newRow >= 0 and newRow < self._num_rows and newCol >= 0 and newCol < cols:
+                neighbor = newRow * cols + newCol
+                if cells[neighbor] != _BLOCKED:
+                    # a diagonal move may not cut the corner of a blocked cell
+                    if nextRow and nextCol and (cells[currentRow * cols + newCol] == _BLOCKED or
+                                                cells[newRow * cols + currentCol] == _BLOCKED):
+                        continue
+                    validNeigh.append(neighbor)
+        return validNeigh
+
+    def _buildAdjacency(self, order: SearchOrder) -> tuple[array, array]:
+        ''' method to precompute, for a deterministic SearchOrder, the open
+            neighbors of every cell in compressed sparse row form: the
+            neighbors of cell i are neighbors[offsets[i] : offsets[i + 1]]
+        Parameters:
+            order: SearchOrder enum -- any but RANDOM and RANDOM8
+        Returns:
+            a tuple (offsets, neighbors) of int arrays
+        '''
+        rows, cols = self._num_rows, self._num_cols
+        cells = self._cells
+        # the offsets count neighbor entries, up to four (or eight) per cell,
+        # so they pass 2**31 on a far smaller grid than the cell indices do
+        offsets = array('i' if len(_DIRECTIONS[order]) * rows * cols < 1 << 31 else 'q', [0]) * (rows * cols + 1)
+        neighbors = array('i' if rows * cols <= 1 << 31 else 'q')
+        for row in range(rows):
+            for col in range(cols):
+                for nextRow, nextCol in _DIRECTIONS[order]:
+                    newRow = row + nextRow
+                    newCol = col + nextCol
+                    if newRow >= 0 and newRow < rows and newCol >= 0 and newCol < cols:
+                        neighbor = newRow * cols + newCol
+                        if cells[neighbor] != _BLOCKED:
+                            if nextRow and nextCol and (cells[row * cols + newCol] == _BLOCKED or
+                                                        cells[newRow * cols + col] == _BLOCKED):
+                                continue
+                            neighbors.append(neighbor)
+                offsets[row * cols + col + 1] = len(neighbors)
+        return offsets, neighbors
+
+    def _neighborLookup(self, build: bool = False) -> Callable[[int], Sequence[int]]:
+        ''' method to return the function the searches use to list the open
+            neighbors of a cell index, in this Maze's SearchOrder; deterministic
+            orders read from a table (see _buildAdjacency) built on first use
+            if the grid is small, or if asked for, and kept until a cell is
+            changed; otherwise the neighbors are worked out for every cell
+            explored, as they always are for RANDOM and RANDOM8 order (which
+            shuffle them) and for a tiled Maze, whose table would be as big as
+            its grid
+        Parameters:
+            build: whether to build the table whatever the size of the grid
+                   (worth it when many searches will share it)
+        Returns:
+            a function taking a cell index and returning its neighbors' indices
+        '''
+        if self._search_order in _SHUFFLED or isinstance(self._cells, TiledCells):
+            return self._openNeighbors
+        if self._search_order not in self._adjacency:
+            if not build and len(self._cells) > _ADJACENCY_MAX_CELLS:
+                return self._openNeighbors
+            self._adjacency[self._search_order] = self._buildAdjacency(self._search_order)
+        offsets, neighbors = self._adjacency[self._search_order]
+        return lambda index: neighbors[offsets[index] : offsets[index + 1]]
+
+    def setBlocked(self, position: Position, blocked: bool = True) -> None:
+        ''' method to block or clear a cell after the Maze has been created;
+            any precomputed neighbor tables and distance fields are
+            discarded, since they no longer match the grid, while the
+            component labels (if built) are updated in place
+        Parameters:
+            position: Position object indicating the (row,col) of the cell
+            blocked:  True to block the cell, False to make it empty
+        Raises:
+            ValueError if row/col of position is out of range
+            ValueError if position is the start or goal
+        '''
+        if position.row < 0 or position.row >= self._num_rows or \
+           position.col < 0 or position.col >= self._num_cols:
+            raise ValueError("invalid (row,col) given for cell")
+        if position == self._start._position or position == self._goal._position:
+            raise ValueError("the start and goal cells cannot be changed")
+        contents = Contents.BLOCKED if blocked else Contents.EMPTY
+        index = self._index(position)
+        self._cells[index] = _CODE[contents]
+        if self._grid is not None:
+            self._grid[position.row][position.col]._contents = contents
+        self._adjacency.clear()
+        with self._fields_lock:
+            self._distance_fields.clear()
+        if self._components is not None:
+            if blocked:
+                self._components.block(index)
+            else:
+                self._components.clear(index)
+
+    def setCosts(self, costs: Sequence[int] | None) -> None:
+        ''' method to give every cell a cost of moving into it, which dijkstra
+            and aStar find the cheapest path under (every move costs 1 until
+            this is called); the costs are kept in a typed array, two bytes a
+            cell, and the other searches still count steps, ignoring them,
+            except aStar's jump points and Replanner.DStarLite, which refuse a
+            Maze with costs
+        Parameters:
+            costs: one cost per cell, row-major (indexed by row * cols + col),
+                   each an int from 0 to 65535, or None to make every move
+                   cost 1 again
+        Raises:
+            ValueError if there is not one cost per cell, or a cost is out of range
+        '''
+        if costs is None:
+            self._costs, self._min_cost = None, 1
+            return
+        if len(costs) != len(self._cells):
+            raise ValueError("there must be one cost per cell")
+        try:
+            self._costs = array('H', costs)
+        except OverflowError:
+            raise ValueError("costs must be ints from 0 to 65535")
+        self._min_cost = min(self._costs)
+
+    def setCost(self, position: Position, cost: int) -> None:
+        ''' method to change the cost of moving into one cell (giving every
+            other cell a cost of 1 if no costs were set); raising the cost of
+            the cheapest cell leaves the A* heuristic scaled by its old cost,
+            which is still admissible, just less informed
+        Parameters:
+            position: Position object indicating the (row,col) of the cell
+            cost:     the new cost, an int from 0 to 65535
+        Raises:
+            ValueError if row/col of position is out of range, or cost is out of range
+        '''
+        index = self._checkedIndex(position)
+        if cost < 0 or cost > 65535:
+            raise ValueError("costs must be ints from 0 to 65535")
+        if self._costs is None:
+            self._costs = array('H', [1]) * len(self._cells)
+        self._costs[index] = cost
+        self._min_cost = min(self._min_cost, cost)
+
+    def getCost(self, position: Position) -> int:
+        ''' accessor method to return the cost of moving into a cell
+        Parameters:
+            position: Position object indicating the (row,col) of the cell
+        Returns:
+            the cell's cost (1 if no costs were set)
+        Raises:
+            ValueError if row/col of position is out of range
+        '''
+        index = self._checkedIndex(position)
+        return 1 if self._costs is None else self._costs[index]
+
+    def isReachable(self, start: Position = None, goal: Position = None) -> bool:
+        ''' method to check whether a path of open cells joins two cells,
+            without searching; the first call labels the connected regions of
+            open cells (unless the Maze was created with components=True), and
+            each check after that is a comparison of two labels
+        Parameters:
+            start: Position object of one cell (the Maze start if not given)
+            goal:  Position object of the other (the Maze goal if not given)
+        Returns:
+            True if both cells are open and some path joins them, False o/w
+        Raises:
+            ValueError if row/col of start or goal is out of range
+            ValueError if the Maze is tiled (see load)
+        '''
+        start = self._checkedIndex(self._start._position if start is None else start)
+        goal  = self._checkedIndex(self._goal._position if goal is None else goal)
+        return self._componentLabels().connected(start, goal)
 
-        return validNeigh   
+    def _componentLabels(self) -> ComponentLabels:
+        ''' method to return the component labels, building them if needed
+        Returns:
+            the ComponentLabels of this Maze, kept up to date from then on
+        Raises:
+            ValueError if the Maze is tiled, since labelling reads every tile
+                       and keeps four bytes per cell
+        '''
+        # the labels join cells four ways whatever the SearchOrder: a diagonal
+        # move may not cut a corner, so it only joins cells already joined
+        # through one of the two cells it passes between
+        if self._components is None:
+            if isinstance(self._cells, TiledCells):
+                raise ValueError("component labels need a label per cell, so a tiled Maze cannot have them")
+            self._components = ComponentLabels(self._cells, self._num_rows, self._num_cols, _BLOCKED)
+        return self._components
+
+    def distanceField(self, goal: Position = None) -> array:
+        ''' method to return the fewest steps from every cell to a goal, found
+            by one BFS outward from the goal; the fields of the few goals most
+            recently asked about are cached until a cell is changed, so any
+            start's path to one of them can then be read off (see fieldPath)
+        Parameters:
+            goal: Position object of the goal (the Maze goal if not given)
+        Returns:
+            an int array giving, per cell index (row * cols + col), the number
+            of steps from that cell to the goal, or -1 where there is no path
+            (shared with the cache, so not to be modified)
+        Raises:
+            ValueError if row/col of goal is out of range
+        '''
+        return self._distanceField(self._checkedIndex(self._goal._position if goal is None else goal))
 
+    def _distanceField(self, goal: int) -> array:
+        ''' method doing the work of distanceField for a goal cell index
+        Parameters:
+            goal: index (row * cols + col) of the goal cell
+        Returns:
+            the distance field of the goal, from the cache if there
+        '''
+        # the cache is only read and changed holding the lock; a field is
+        # built outside it, so threads wanting different goals build at once
+        with self._fields_lock:
+            field = self._distance_fields.pop(goal, None)
+            if field is not None:
+                self._distance_fields[goal] = field
+                return field
+        field = self._cellTable('i', -1)
+        if self._cells[goal] != _BLOCKED:
+            # BFS one layer at a time; moves are reversible, so the steps
+            # out from the goal are the steps back to it
+            field[goal] = 0
+            neighborsOf = self._neighborLookup()
+            layer = [goal]
+            distance = 0
+            while layer:
+                distance += 1
+                next_layer = []
+                for cell in layer:
+                    for neighbor in neighborsOf(cell):
+                        if field[neighbor] < 0:
+                            field[neighbor] = distance
+                            next_layer.append(neighbor)
+                layer = next_layer
+        with self._fields_lock:
+            self._distance_fields.pop(goal, None)
+            while len(self._distance_fields) >= _DISTANCE_FIELDS_KEPT:
+                del self._distance_fields[next(iter(self._distance_fields))]
+            self._distance_fields[goal] = field
+        return field
+
+    def fieldPath(self, start: Position = None, goal: Position = None) -> SearchResult:
+        ''' method to find a shortest path without searching, by stepping from
+            the start to any neighbor one step closer in the goal's distance
+            field (built first if not cached), so the cost is the path length
+        Parameters:
+            start: Position object of the start (the Maze start if not given)
+            goal:  Position object of the goal (the Maze goal if not given)
+        Returns:
+            a SearchResult holding the path to the goal (if there is one),
+            which can be given to calculatePathLength or showPath; no cells
+            are counted as explored
+        Raises:
+            ValueError if row/col of start or goal is out of range
+        '''
+        return self._fieldPath(self._checkedIndex(self._start._position if start is None else start),
+                               self._checkedIndex(self._goal._position if goal is None else goal))
 
-    def dfs(self) -> Cell | None:
+    def _fieldPath(self, start: int, goal: int) -> SearchResult:
+        ''' method doing the work of fieldPath, between any two cells
+        Parameters:
+            start: index (row * cols + col) of the cell to start from
+            goal:  index of the goal cell
+        Returns:
+            a SearchResult as for fieldPath
+        '''
+        field = self._distanceField(goal)
+        if self._cells[start] == _BLOCKED or field[start] < 0:
+            return SearchResult(self, array('q'), 0, None)
+        # only the cells on the path get a parent, so no per-cell array is made
+        parents = {start: -1}
+        neighborsOf = self._neighborLookup()
+        current = start
+        while field[current] > 0:
+            for neighbor in neighborsOf(current):
+                if field[neighbor] == field[current] - 1:
+                    parents[neighbor] = current
+                    current = neighbor
+                    break
+        return SearchResult(self, parents, 0, goal)
+
+    def solveMany(self, pairs: Sequence[tuple[Position, Position]], algorithm: str = "bfs", \
+                        workers: int = 1, processes: bool = False) -> list[QueryResult]:
+        ''' method to search between many (start, goal) pairs of this Maze
+            without changing its own start and goal; the neighbor tables and
+            the component labels are built once up front and shared by every
+            query, so pairs that cannot be joined are answered without searching
+            (a tiled Maze skips the labels, which would not fit its memory
+            budget, and searches every pair)
+        Parameters:
+            pairs:     (start, goal) Position pairs, any cells of the grid
+            algorithm: "dfs", "bfs", "aStar", "dijkstra", "idaStar",
+                       "bidirectionalBfs" or "fieldPath" (which suits many
+                       starts sharing few goals)
+            workers:   number of threads (or processes) to spread the queries
+                       over; 1 answers them one after another in this thread
+            processes: whether the workers are processes, each searching its
+                       own copy of the Maze, rather than threads, which share
+                       this one but take turns holding the interpreter lock
+        Returns:
+            one QueryResult per pair, in the same order as pairs
+        Raises:
+            ValueError if algorithm is not one of the above
+            ValueError if row/col of any start or goal is out of range
+        '''
+        if algorithm not in ("dfs", "bfs", "aStar", "dijkstra", "idaStar", "bidirectionalBfs", "fieldPath"):
+            raise ValueError(f"unknown algorithm {algorithm}")
+        queries = [(self._checkedIndex(start), self._checkedIndex(goal), algorithm) for start, goal in pairs]
+        # build everything the searches share before any worker starts
+        if not isinstance(self._cells, TiledCells):
+            self._componentLabels()
+        self._neighborLookup(build=True)
+
+        if workers <= 1:
+            return [self._answer(*query) for query in queries]
+        if not processes:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(lambda query: self._answer(*query), queries))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_setSolverMaze, initargs=(self,)) as pool:
+            return _mapInChunks(pool, _solveQuery, queries, workers)
+
+    def _answer(self, start: int, goal: int, algorithm: str) -> QueryResult:
+        ''' method to run one query of solveMany
+        Parameters:
+            start:     index (row * cols + col) of the cell to search from
+            goal:      index of the cell to search for
+            algorithm: name of the public search to run
+        Returns:
+            a QueryResult for the pair
+        '''
+        result = getattr(self, "_" + algorithm)(start, goal)
+        cols = self._num_cols
+        return QueryResult(Position(*divmod(start, cols)), Position(*divmod(goal, cols)), result.isFound(),
+                           result.getPathLength(), result.getNumCellsExplored(), result.getPath())
+
+    def _endpoints(self) -> tuple[int, int]:
+        ''' method to return the cell indices the public searches run between
+        Returns:
+            the indices (row * cols + col) of the Maze start and goal
+        '''
+        return self._index(self._start._position), self._index(self._goal._position)
+
+    def _rejectUnreachable(self, start: int, goal: int, algorithm: str, \
+                                 stats: SearchStats | None) -> SearchResult | None:
+        ''' method used at the top of each search to skip it when either end
+            is blocked, or the component labels (if built) already show that
+            the goal cannot be reached
+        Parameters:
+            start:     index of the cell the search starts from
+            goal:      index of the cell it looks for
+            algorithm: name of the search, for stats
+            stats:     the SearchStats passed to the search, if any
+        Returns:
+            a SearchResult with no path and no cells explored, or None if the
+            search should go ahead
+        '''
+        if self._cells[start] != _BLOCKED and self._cells[goal] != _BLOCKED and \
+           (self._components is None or self._components.connected(start, goal)):
+            return None
+        if stats is not None:
+            stats.record(SearchMetrics(algorithm, False, 0.0, 0.0, 0.0, 0, 0, 0, 0, 0))
+        return SearchResult(self, array('q'), 0, None)
+
+    def _cellTable(self, typecode: str | None, fill: int | None) -> Sequence:
+        ''' method to make the table a search keeps per cell index (whether
+            seen, the parent, the distance), with every entry set to fill
+        Parameters:
+            typecode: array typecode of the entries, or None for a list
+            fill:     the entry every cell starts with
+        Returns:
+            an array (a bytearray for byte entries, which index faster, or a
+            list) with one entry per cell of the grid, or for a tiled Maze a
+            _SparseTable, holding only the cells a search reaches
+        '''
+        if isinstance(self._cells, TiledCells):
+            return _SparseTable(fill)
+        if typecode is None:
+            return [fill] * len(self._cells)
+        if typecode == 'B':
+            return bytearray([fill]) * len(self._cells)
+        return array(typecode, [fill]) * len(self._cells)
+
+    def _checkedIndex(self, position: Position) -> int:
+        ''' method to flatten a (row,col) Position that may not be in the grid
+        Parameters:
+            position: a Position object
+        Returns:
+            the int row * cols + col
+        Raises:
+            ValueError if row/col of position is out of range
+        '''
+        if position.row < 0 or position.row >= self._num_rows or \
+           position.col < 0 or position.col >= self._num_cols:
+            raise ValueError("invalid (row,col) given for cell")
+        return self._index(position)
+
+    def _index(self, position: Position) -> int:
+        ''' method to flatten a (row,col) Position into an index into a
+            row-major array covering the whole grid
+        Parameters:
+            position: a Position object within the grid
+        Returns:
+            the int row * cols + col
+        '''
+        return position.row * self._num_cols + position.col
+
+    def dfs(self, stats: SearchStats = None) -> SearchResult:
         ''' method to perform DFS (using a stack) to implement maze searching
+        Parameters:
+            stats: optional SearchStats to record this search's timings and
+                   counts in (nothing extra is measured when not given)
         Returns:
-            a Cell object corresponding to the Maze goal, or None if no goal
-            can be found
+            a SearchResult holding the path to the Maze goal (if one can be
+            found) and the number of cells explored
         ''' 
-        #Use DFS + stack:
-        #    stack: push new Cell objects to be explored
-        #            (which should also keep track of the parent)
-        #    list:  cells already explored
+        return self._dfs(*self._endpoints(), stats)
+
+    def dfsSteps(self, stats: SearchStats = None, pushes: bool = False) -> Iterator[SearchStep]:
+        ''' generator version of dfs, which yields an event as each step of
+            the search happens, so a caller can follow its progress, stop it
+            early, or take turns stepping several searches
+        Parameters:
+            stats:  as for dfs (the times include any time spent by the
+                    caller between steps)
+            pushes: whether to also yield an event for every cell added to
+                    the stack, not only for every cell expanded
+        Returns:
+            an iterator of (SearchEvent, cell index or SearchResult) tuples,
+            ending with (SearchEvent.FINISHED, the SearchResult dfs returns)
+        '''
+        return self._dfsSteps(*self._endpoints(), stats, pushes)
+
+    def _dfs(self, start: int, goal: int, stats: SearchStats = None) -> SearchResult:
+        ''' method doing the work of dfs, between any two cells, by running
+            _dfsSteps to the end
+        Parameters:
+            start: index (row * cols + col) of the cell to search from
+            goal:  index of the cell to search for
+            stats: as for dfs
+        Returns:
+            a SearchResult as for dfs
+        '''
+        return _finalResult(self._dfsSteps(start, goal, stats))
+
+    def _dfsSteps(self, start: int, goal: int, stats: SearchStats = None, \
+                        pushes: bool = False) -> Iterator[SearchStep]:
+        ''' generator doing the work of dfsSteps, between any two cells
+        Parameters:
+            start:  index (row * cols + col) of the cell to search from
+            goal:   index of the cell to search for
+            stats:  as for dfs
+            pushes: as for dfsSteps
+        Returns:
+            an iterator of steps as for dfsSteps
+        '''
+        rejected = self._rejectUnreachable(start, goal, "dfs", stats)
+        if rejected is not None:
+            yield (SearchEvent.FINISHED, rejected)
+            return
 
-        pathStack = Stack()
-        pathStack.push(self._start)
-        visitedCells = [self._start.getPosition()]
+        track = stats is not None
+        if track: setup_begin = time.perf_counter()
+        #Use DFS + stack:
+        #    stack: push new cell indices to be explored
+        #    bytearray: one flag per grid cell, set once a cell has been seen
+        #               (indexed by row * cols + col, so each check is O(1))
+        #    array: per cell index, the index of the cell it was reached from
+        # a tracked frontier remembers its peak size, so the loop itself
+        # never has to check whether stats are wanted
+        pathStack = _TrackedStack() if track else Stack()
+        pathStack.push(start)
+        visitedCells = self._cellTable('B', 0)
+        visitedCells[start] = 1
+        parents = self._cellTable('q', -1)
+        num_cells_explored = 0
+        neighborsOf = self._neighborLookup()
+        EXPANDED, PUSHED = SearchEvent.EXPANDED, SearchEvent.PUSHED
+        if track: search_begin = time.perf_counter()
         
         while not pathStack.is_empty():
-            currentCell = pathStack.pop()
+            current = pathStack.pop()
 
-            if currentCell.isGoal():
-                return currentCell
+            if current == goal:
+                yield (SearchEvent.FOUND, goal)
+                break
+            yield (EXPANDED, current)
             
-            validNeighbors = self.getSearchLocations(currentCell)
-            for neighbor in validNeighbors:
-                if neighbor.getPosition() not in visitedCells:
-                    visitedCells.append(neighbor.getPosition())
-                    neighbor.setParent(currentCell)
+            for neighbor in neighborsOf(current):
+                if not visitedCells[neighbor]:
+                    visitedCells[neighbor] = 1
+                    parents[neighbor] = current
                     pathStack.push(neighbor)
-                    self._num_cells_explored+=1
-
-
-        print(f"Goal not attainable and number cells explroed is {self._num_cells_explored}")
-        return None
+                    num_cells_explored+=1
+                    if pushes: yield (PUSHED, neighbor)
+        else:
+            goal = None
+
+        if not track:
+            yield (SearchEvent.FINISHED, SearchResult(self, parents, num_cells_explored, goal))
+            return
+        path_begin = time.perf_counter()
+        result = SearchResult(self, parents, num_cells_explored, goal)
+        stats.record(SearchMetrics("dfs", goal is not None, search_begin - setup_begin,
+                                   path_begin - search_begin, time.perf_counter() - path_begin,
+                                   num_cells_explored + 1 - len(pathStack), num_cells_explored + 1, 0, pathStack.peak,
+                                   sys.getsizeof(visitedCells) + sys.getsizeof(parents)))
+        yield (SearchEvent.FINISHED, result)
             
 
-    def bfs(self) -> Cell | None:
+    def bfs(self, vectorized: bool = False, stats: SearchStats = None) -> SearchResult:
         ''' method to perform BFS (using a queue) to implement maze searching
+        Parameters:
+            vectorized: whether to expand each whole BFS layer at once with
+                        numpy (see Wavefront.py) rather than one cell at a
+                        time; the path found is a shortest path either way,
+                        though not necessarily the same one
+            stats:      optional SearchStats to record this search's timings
+                        and counts in (nothing extra is measured when not given)
         Returns:
-            a Cell object corresponding to the Maze goal, or None if no goal
-            can be found
+            a SearchResult holding the path to the Maze goal (if one can be
+            found) and the number of cells explored
+        Raises:
+            ValueError if vectorized for a tiled Maze (see load) or one that
+                       moves diagonally
         ''' 
+        return self._bfs(*self._endpoints(), vectorized, stats)
+
+    def bfsSteps(self, stats: SearchStats = None, pushes: bool = False) -> Iterator[SearchStep]:
+        ''' generator version of bfs (one cell at a time), which yields an
+            event as each step of the search happens (see dfsSteps)
+        Parameters:
+            stats:  as for bfs (the times include any time spent by the
+                    caller between steps)
+            pushes: whether to also yield an event for every cell added to
+                    the queue, not only for every cell expanded
+        Returns:
+            an iterator of (SearchEvent, cell index or SearchResult) tuples,
+            ending with (SearchEvent.FINISHED, the SearchResult bfs returns)
+        '''
+        return self._bfsSteps(*self._endpoints(), stats, pushes)
+
+    def _bfs(self, start: int, goal: int, vectorized: bool = False, stats: SearchStats = None) -> SearchResult:
+        ''' method doing the work of bfs, between any two cells, by running
+            _bfsSteps to the end (or _wavefrontBfs if vectorized)
+        Parameters:
+            start:      index (row * cols + col) of the cell to search from
+            goal:       index of the cell to search for
+            vectorized: as for bfs
+            stats:      as for bfs
+        Returns:
+            a SearchResult as for bfs
+        '''
+        if vectorized:
+            if isinstance(self._cells, TiledCells):
+                raise ValueError("vectorized bfs needs the whole grid in memory, so a tiled Maze cannot use it")
+            if self._search_order in _EIGHT_WAY:
+                raise ValueError("vectorized bfs only moves in four directions")
+            rejected = self._rejectUnreachable(start, goal, "bfs", stats)
+            return rejected if rejected is not None else self._wavefrontBfs(start, goal, stats)
+        return _finalResult(self._bfsSteps(start, goal, stats))
+
+    def _bfsSteps(self, start: int, goal: int, stats: SearchStats = None, \
+                        pushes: bool = False) -> Iterator[SearchStep]:
+        ''' generator doing the work of bfsSteps, between any two cells
+        Parameters:
+            start:  index (row * cols + col) of the cell to search from
+            goal:   index of the cell to search for
+            stats:  as for bfs
+            pushes: as for bfsSteps
+        Returns:
+            an iterator of steps as for bfsSteps
+        '''
+        rejected = self._rejectUnreachable(start, goal, "bfs", stats)
+        if rejected is not None:
+            yield (SearchEvent.FINISHED, rejected)
+            return
+
+        track = stats is not None
+        if track: setup_begin = time.perf_counter()
         #Use BFS + queue:
-        #    queue: push new Cell objects to be explored
-        #            (which should also keep track of the parent)
-        #    list:  cells already explored
-        pathQueue = Queue()
-        pathQueue.push(self._start)
-        visitedCells = [self._start.getPosition()]
+        #    queue: push new cell indices to be explored
+        #    bytearray: one flag per grid cell, set once a cell has been seen
+        #    array: per cell index, the index of the cell it was reached from
+        # a tracked frontier remembers its peak size, so the loop itself
+        # never has to check whether stats are wanted
+        pathQueue = _TrackedQueue() if track else Queue()
+        pathQueue.push(start)
+        visitedCells = self._cellTable('B', 0)
+        visitedCells[start] = 1
+        parents = self._cellTable('q', -1)
+        num_cells_explored = 0
+        neighborsOf = self._neighborLookup()
+        EXPANDED, PUSHED = SearchEvent.EXPANDED, SearchEvent.PUSHED
+        if track: search_begin = time.perf_counter()
+
         while not pathQueue.isEmpty():
-            currentCell = pathQueue.pop()
+            current = pathQueue.pop()
 
-            if currentCell.isGoal():
-                return currentCell
+            if current == goal:
+                yield (SearchEvent.FOUND, goal)
+                break
+            yield (EXPANDED, current)
             
-            validNeighbors = self.getSearchLocations(currentCell)
-            for neighbor in validNeighbors:
-                if neighbor.getPosition() not in visitedCells:
-                    visitedCells.append(neighbor.getPosition())
-                    neighbor.setParent(currentCell)
+            for neighbor in neighborsOf(current):
+                if not visitedCells[neighbor]:
+                    visitedCells[neighbor] = 1
+                    parents[neighbor] = current
                     pathQueue.push(neighbor)            
-                    self._num_cells_explored+=1
-
+                    num_cells_explored+=1
+                    if pushes: yield (PUSHED, neighbor)
+        else:
+            goal = None
+
+        if not track:
+            yield (SearchEvent.FINISHED, SearchResult(self, parents, num_cells_explored, goal))
+            return
+        path_begin = time.perf_counter()
+        result = SearchResult(self, parents, num_cells_explored, goal)
+        stats.record(SearchMetrics("bfs", goal is not None, search_begin - setup_begin,
+                                   path_begin - search_begin, time.perf_counter() - path_begin,
+                                   num_cells_explored + 1 - len(pathQueue), num_cells_explored + 1, 0, pathQueue.peak,
+                                   sys.getsizeof(visitedCells) + sys.getsizeof(parents)))
+        yield (SearchEvent.FINISHED, result)
+
+    def bidirectionalBfs(self) -> SearchResult:
+        ''' method to perform BFS from the start and the goal at the same time
+            (one whole layer at a time, always growing the smaller frontier),
+            stopping once the two searches meet
+        Returns:
+            a SearchResult holding the path to the Maze goal (if one can be
+            found) and the number of cells explored by both searches
+        '''
+        return self._bidirectionalBfs(*self._endpoints())
 
+    def _bidirectionalBfs(self, start: int, goal: int) -> SearchResult:
+        ''' method doing the work of bidirectionalBfs, between any two cells
+        Parameters:
+            start: index (row * cols + col) of the cell to search from
+            goal:  index of the cell to search for
+        Returns:
+            a SearchResult as for bidirectionalBfs
+        '''
+        rejected = self._rejectUnreachable(start, goal, "bidirectionalBfs", None)
+        if rejected is not None:
+            return rejected
+        if start == goal:
+            return SearchResult(self, self._cellTable('q', -1), 0, goal)
+
+        #Use two BFS queues, one per direction:
+        #    bytearray: which search (1 = from start, 2 = from goal) has seen each cell
+        #    arrays:    per cell, the cell it was reached from and its distance
+        #               from whichever end reached it
+
+        owner = self._cellTable('B', 0)
+        parents = self._cellTable('q', -1)
+        distances = self._cellTable('i', 0)
+        queues = {1: Queue(), 2: Queue()}
+        queues[1].push(start); owner[start] = 1
+        queues[2].push(goal);  owner[goal]  = 2
+        num_cells_explored = 0
+        neighborsOf = self._neighborLookup()
+
+        meeting = None   # (length, cell on start side, cell on goal side)
+        while meeting is None and not queues[1].isEmpty() and not queues[2].isEmpty():
+            side = 1 if len(queues[1]) <= len(queues[2]) else 2
+            other = 3 - side
+            queue = queues[side]
+            # finish the whole layer, so the shortest of the meetings is kept
+            for _ in range(len(queue)):
+                current = queue.pop()
+                for neighbor in neighborsOf(current):
+                    if owner[neighbor] == 0:
+                        owner[neighbor] = side
+                        parents[neighbor] = current
+                        distances[neighbor] = distances[current] + 1
+                        queue.push(neighbor)
+                        num_cells_explored+=1
+                    elif owner[neighbor] == other:
+                        length = distances[current] + 1 + distances[neighbor]
+                        if meeting is None or length < meeting[0]:
+                            meeting = (length, current, neighbor) if side == 1 else (length, neighbor, current)
+
+        if meeting is None:
+            return SearchResult(self, array('q'), num_cells_explored, None)
+
+        # keep the start side's parents, then turn the goal side's chain
+        # (which points toward the goal) around so it points toward the start
+        _, current, neighbor = meeting
+        while current != goal:
+            following = parents[neighbor]
+            parents[neighbor] = current
+            current, neighbor = neighbor, following
+        return SearchResult(self, parents, num_cells_explored, goal)
+
+    def _wavefrontBfs(self, start: int, goal: int, stats: SearchStats = None) -> SearchResult:
+        ''' method to perform BFS one whole layer at a time with numpy, then
+            rebuild a path by descending the resulting distances from the goal
+        Parameters:
+            start: index (row * cols + col) of the cell to search from
+            goal:  index of the cell to search for
+            stats: optional SearchStats to record this search's timings and
+                   counts in; each cell reached counts as one push and one
+                   expansion, and the frontier is not tracked
+        Returns:
+            a SearchResult holding the path to the Maze goal (if one can be
+            found) and the number of cells reached
+        Raises:
+            ImportError if numpy is not installed
+        '''
+        if stats is not None: search_begin = time.perf_counter()
+        distances, num_cells_explored = wavefrontDistances(self._cells, self._num_rows, self._num_cols,
+                                                           start, goal, _BLOCKED)
+        if stats is not None: path_begin = time.perf_counter()
+        parents = array('q', [-1]) * len(self._cells)
+        if distances[goal] < 0:
+            goal = None
+        else:
+            path = descendPath(distances, self._num_cols, goal)
+            for child, parent in zip(path, path[1:]):
+                parents[child] = parent
+        result = SearchResult(self, parents, num_cells_explored, goal)
+        if stats is not None:
+            stats.record(SearchMetrics("bfs", goal is not None, 0.0, path_begin - search_begin,
+                                       time.perf_counter() - path_begin, num_cells_explored + 1,
+                                       num_cells_explored + 1, 0, 0, distances.nbytes))
+        return result
+
+    def aStar(self, jump_points: bool = False, \
+                    queue: PriorityQueue | IndexedPriorityQueue | BucketQueue = None, \
+                    tie_break: bool = True, \
+                    stats: SearchStats = None) -> SearchResult:
+        ''' method to perform A* (using a priority queue keyed on f = g + h,
+            with g the cost of the path so far -- its length unless the Maze
+            has costs, see setCosts, or moves diagonally, see getPathCost --
+            and h the Manhattan distance to the goal, or with diagonal moves
+            the octile distance, times the least cost of a cell) to implement
+            maze searching
+        Parameters:
+            jump_points: whether to use Jump Point Search, which only puts the
+                         cells where a path may need to turn into the
+                         priority queue (see _jumpPointSearch); not for a
+                         Maze with costs
+            queue:       an empty queue to use as the frontier (a new
+                         PriorityQueue if not given), e.g. an
+                         IndexedPriorityQueue, which lowers the key of a cell
+                         already waiting instead of adding a second entry,
+                         or a BucketQueue, which suits f values spanning a
+                         small range of ints (its time grows with the range,
+                         so with the costs of the steps, though its memory
+                         does not); its getStats() can be read after the search
+            tie_break:   whether cells with equal f come out lowest h first
+                         (equivalently, highest g first), so the search heads
+                         on toward the goal instead of widening across a
+                         plateau of equal f; otherwise they come out in the
+                         order they were added from a PriorityQueue or
+                         IndexedPriorityQueue, and the reverse order (most
+                         recently added first) from a BucketQueue
+            stats:       optional SearchStats to record this search's timings
+                         and counts in (nothing extra is measured when not given)
+        Returns:
+            a SearchResult holding the path to the Maze goal (if one can be
+            found) and the number of cells explored
+        Raises:
+            ValueError if jump_points is asked for on a Maze with costs, or
+                       one that moves diagonally
+        '''
+        return self._aStar(*self._endpoints(), jump_points, queue, tie_break, stats)
 
-        print(f"Goal not attainable and number cells explored is {self._num_cells_explored}")
-        return None
-    
-    def aStar(self) -> Cell | None:
-        to_explore: PriorityQueue[float, Cell] = PriorityQueue()
-        explored: dict[Position, float] = {}
+    def aStarSteps(self, queue: PriorityQueue | IndexedPriorityQueue | BucketQueue = None, \
+                         tie_break: bool = True, stats: SearchStats = None, \
+                         pushes: bool = False) -> Iterator[SearchStep]:
+        ''' generator version of aStar (without jump points), which yields an
+            event as each step of the search happens (see dfsSteps)
+        Parameters:
+            queue:     as for aStar
+            tie_break: as for aStar
+            stats:     as for aStar (the times include any time spent by the
+                       caller between steps)
+            pushes:    whether to also yield an event for every cell added to
+                       the queue (or given a lower key there), not only for
+                       every cell expanded
+        Returns:
+            an iterator of (SearchEvent, cell index or SearchResult) tuples,
+            ending with (SearchEvent.FINISHED, the SearchResult aStar returns)
+        Raises:
+            ValueError as for aStar's queue, on taking the first step
+        '''
+        return self._aStarSteps(*self._endpoints(), queue, tie_break, stats, pushes)
 
-        n = self.getStart()
+    def _aStar(self, start: int, goal: int, jump_points: bool = False, \
+                     queue: PriorityQueue | IndexedPriorityQueue | BucketQueue = None, \
+                     tie_break: bool = True, stats: SearchStats = None) -> SearchResult:
+        ''' method doing the work of aStar, between any two cells, by running
+            _aStarSteps to the end (or _jumpPointSearch if jump_points)
+        Parameters:
+            start: index (row * cols + col) of the cell to search from
+            goal:  index of the cell to search for
+            (the rest as for aStar)
+        Returns:
+            a SearchResult as for aStar
+        '''
+        if jump_points:
+            if self._costs is not None:
+                raise ValueError("jump points need every move to cost the same")
+            if self._search_order in _EIGHT_WAY:
+                raise ValueError("jump points only move in four directions")
+            rejected = self._rejectUnreachable(start, goal, "aStar", stats)
+            if rejected is not None:
+                return rejected
+            return self._jumpPointSearch(start, goal, PriorityQueue() if queue is None else queue, tie_break, stats)
+        return _finalResult(self._aStarSteps(start, goal, queue, tie_break, stats))
+
+    def _aStarSteps(self, start: int, goal: int, \
+                          queue: PriorityQueue | IndexedPriorityQueue | BucketQueue = None, \
+                          tie_break: bool = True, stats: SearchStats = None, \
+                          pushes: bool = False, dijkstra: bool = False) -> Iterator[SearchStep]:
+        ''' generator doing the work of aStarSteps, between any two cells
+        Parameters:
+            start:    index (row * cols + col) of the cell to search from
+            goal:     index of the cell to search for
+            dijkstra: whether to leave out the heuristic (see dijkstra)
+            (the rest as for aStarSteps)
+        Returns:
+            an iterator of steps as for aStarSteps
+        '''
+        algorithm = "dijkstra" if dijkstra else "aStar"
+        rejected = self._rejectUnreachable(start, goal, algorithm, stats)
+        if rejected is not None:
+            yield (SearchEvent.FINISHED, rejected)
+            return
+
+        to_explore = PriorityQueue() if queue is None else queue
+        track = stats is not None
+        if track: setup_begin = time.perf_counter()
+        indexed = isinstance(to_explore, IndexedPriorityQueue)
+        # best-known g cost per grid cell (indexed by row * cols + col),
+        # None for cells that have not been reached yet
+        explored: list[int | None] = self._cellTable(None, None)
+        parents = self._cellTable('q', -1)
+        num_cells_explored = 0
+        expansions = 0
+        stale_pops = 0
+        peak_frontier = 0
+        neighborsOf = self._neighborLookup()
+        # every step costs at least the least cell cost, so the Manhattan
+        # distance times that never overestimates the cost to the goal
+        costs = self._costs
+        scale = 0 if dijkstra else self._min_cost
+        cols = self._num_cols
+        goal_row, goal_col = divmod(goal, cols)
+        # moving diagonally, a move's cost depends on its direction, and the
+        # octile distance (the cost of the cheapest path were no cell blocked)
+        # takes the place of the Manhattan distance
+        diagonal = self._search_order in _EIGHT_WAY
+
+        def octile(index: int) -> int:
+            row, col = divmod(index, cols)
+            d_row, d_col = abs(row - goal_row), abs(col - goal_col)
+            return (_STRAIGHT_COST * max(d_row, d_col) + (_DIAGONAL_COST - _STRAIGHT_COST) * min(d_row, d_col)) * scale
+
+        n = start
+        n_row, n_col = divmod(n, cols)
         g_n = 0
-        h_n = abs(n.getPosition().col - self.getGoal().getPosition().col) + abs(n.getPosition().row - self.getGoal().getPosition().row)
+        h_n = octile(n) if diagonal else (abs(n_col - goal_col) + abs(n_row - goal_row)) * scale
         f_n = g_n + h_n
 
-        to_explore.insert(f_n, n)
-        explored[n.getPosition()] = g_n
+        to_explore.insert(f_n, n, h_n if tie_break else 0)
+        explored[n] = g_n
+        EXPANDED, PUSHED = SearchEvent.EXPANDED, SearchEvent.PUSHED
+        if track: search_begin = time.perf_counter()
 
         while not to_explore.isEmpty():
+            if track:
+                expansions+=1
+                peak_frontier = max(peak_frontier, len(to_explore))
             e = to_explore.removeMin()
             n = e.value
 
-            if n.isGoal():
-                return n
+            if n == goal:
+                yield (SearchEvent.FOUND, goal)
+                break
+            yield (EXPANDED, n)
+            if track:
+                # an entry left behind when a cheaper path to its cell was found
+                n_row, n_col = divmod(n, cols)
+                h_n = octile(n) if diagonal else (abs(n_col - goal_col) + abs(n_row - goal_row)) * scale
+                if e.key > explored[n] + h_n:
+                    stale_pops+=1
             
-            for m in self.getSearchLocations(n):
-                updated_m_cost = explored[n.getPosition()] + 1
-                if m.getPosition() not in explored or updated_m_cost < explored[m.getPosition()]:
+            for m in neighborsOf(n):
+                step = 1 if costs is None else costs[m]
+                if diagonal:
+                    step *= _STRAIGHT_COST if n // cols == m // cols or n % cols == m % cols else _DIAGONAL_COST
+                updated_m_cost = explored[n] + step
+                if explored[m] is None or updated_m_cost < explored[m]:
                     g_m = updated_m_cost
-                    explored[m.getPosition()] = g_m
-                    h_m = abs(m.getPosition().col -self.getGoal().getPosition().col) + abs(m.getPosition().row - self.getGoal().getPosition().row)
+                    explored[m] = g_m
+                    if diagonal:
+                        h_m = octile(m)
+                    else:
+                        m_row, m_col = divmod(m, cols)
+                        h_m = (abs(m_col - goal_col) + abs(m_row - goal_row)) * scale
                     f_m = g_m + h_m
-                    to_explore.insert(f_m, m)
-                    self._num_cells_explored+=1
-                    m.setParent(n)
+                    tie = h_m if tie_break else 0
+                    if indexed and to_explore.contains(m):
+                        to_explore.decreaseKey(m, f_m, tie)
+                    else:
+                        to_explore.insert(f_m, m, tie)
+                    num_cells_explored+=1
+                    parents[m] = n
+                    if pushes: yield (PUSHED, m)
+        else:
+            goal = None
+
+        if not track:
+            yield (SearchEvent.FINISHED, SearchResult(self, parents, num_cells_explored, goal))
+            return
+        path_begin = time.perf_counter()
+        result = SearchResult(self, parents, num_cells_explored, goal)
+        stats.record(SearchMetrics(algorithm, goal is not None, search_begin - setup_begin,
+                                   path_begin - search_begin, time.perf_counter() - path_begin,
+                                   expansions, num_cells_explored + 1, stale_pops, peak_frontier,
+                                   sys.getsizeof(explored) + sys.getsizeof(parents)))
+        yield (SearchEvent.FINISHED, result)
+
+    def dijkstra(self, queue: PriorityQueue | IndexedPriorityQueue | BucketQueue = None, \
+                       stats: SearchStats = None) -> SearchResult:
+        ''' method to perform Dijkstra's algorithm: A* without the heuristic,
+            so cells come off the priority queue cheapest path first, in
+            every direction alike; it finds the cheapest path under the
+            Maze's costs (see setCosts), as aStar does, but explores more
+            cells to do it, so it mostly serves as a check on aStar
+        Parameters:
+            queue: as for aStar
+            stats: as for aStar
+        Returns:
+            a SearchResult holding the cheapest path to the Maze goal (if one
+            can be found) and the number of cells explored
+        '''
+        return self._dijkstra(*self._endpoints(), queue, stats)
 
-            
+    def _dijkstra(self, start: int, goal: int, \
+                        queue: PriorityQueue | IndexedPriorityQueue | BucketQueue = None, \
+                        stats: SearchStats = None) -> SearchResult:
+        ''' method doing the work of dijkstra, between any two cells
+        Parameters:
+            start: index (row * cols + col) of the cell to search from
+            goal:  index of the cell to search for
+            (the rest as for dijkstra)
+        Returns:
+            a SearchResult as for dijkstra
+        '''
+        return _finalResult(self._aStarSteps(start, goal, queue, False, stats, dijkstra = True))
+
+    def _jumpPointSearch(self, start: int, goal: int, \
+                               to_explore: PriorityQueue | IndexedPriorityQueue | BucketQueue, \
+                               tie_break: bool, stats: SearchStats = None) -> SearchResult:
+        ''' method to perform A* over jump points only, for this 4-connected
+            grid where every step costs 1; among equally short paths, only
+            those that take horizontal steps before vertical ones are
+            followed, so a vertical run turns sideways only where the cell
+            beside the previous one is blocked (a "forced" turn), and a
+            horizontal run stops at a cell only when a vertical run from there
+            leads somewhere; straight runs between jump points are scanned
+            without touching the priority queue (SearchOrder is not used)
+        Parameters:
+            start:      index (row * cols + col) of the cell to search from
+            goal:       index of the cell to search for
+            to_explore: the empty queue to use as the frontier
+            tie_break:  whether cells with equal f come out lowest h first
+            stats:      optional SearchStats to record this search's timings
+                        and counts in (the jump points being what is counted)
+        Returns:
+            a SearchResult holding the full cell-by-cell path to the Maze goal
+            (if one can be found) and the number of jump points explored
+        '''
+        track = stats is not None
+        if track: setup_begin = time.perf_counter()
+        rows, cols = self._num_rows, self._num_cols
+        cells = self._cells
+        goal_row, goal_col = divmod(goal, cols)
+
+        def isOpen(row: int, col: int) -> bool:
+            return 0 <= row < rows and 0 <= col < cols and cells[row * cols + col] != _BLOCKED
+
+        def forcedTurns(row: int, col: int, d_row: int) -> list[int]:
+            # sideways steps from a cell reached vertically that no equally
+            # short horizontal-first path could take instead
+            return [d_col for d_col in (1, -1)
+                    if isOpen(row, col + d_col) and not isOpen(row - d_row, col + d_col)]
+
+        def jumpVertical(row: int, col: int, d_row: int) -> int | None:
+            while True:
+                row += d_row
+                if not isOpen(row, col): return None
+                if (row == goal_row and col == goal_col) or forcedTurns(row, col, d_row):
+                    return row * cols + col
+
+        def jumpHorizontal(row: int, col: int, d_col: int) -> int | None:
+            while True:
+                col += d_col
+                if not isOpen(row, col): return None
+                if (row == goal_row and col == goal_col) or \
+                   jumpVertical(row, col, -1) is not None or jumpVertical(row, col, 1) is not None:
+                    return row * cols + col
+
+        indexed = isinstance(to_explore, IndexedPriorityQueue)
+        explored: list[int | None] = self._cellTable(None, None)
+        parents = self._cellTable('q', -1)   # jump point each was reached from
+        num_cells_explored = 0
+        expansions = 0
+        stale_pops = 0
+        peak_frontier = 0
+
+        n = start
+        n_row, n_col = divmod(n, cols)
+        h_n = abs(n_col - goal_col) + abs(n_row - goal_row)
+        to_explore.insert(h_n, n, h_n if tie_break else 0)
+        explored[n] = 0
+        if track: search_begin = time.perf_counter()
 
-        print(f"Goal not attainable and number cells explored is {self._num_cells_explored}")
-        return None
+        while not to_explore.isEmpty():
+            if track:
+                expansions+=1
+                peak_frontier = max(peak_frontier, len(to_explore))
+            e = to_explore.removeMin()
+            n = e.value
+            if n == goal:
+                break
+
+            row, col = divmod(n, cols)
+            if track and e.key > explored[n] + abs(col - goal_col) + abs(row - goal_row):
+                stale_pops+=1
+            if parents[n] < 0:
+                directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+            else:
+                parent_row, parent_col = divmod(parents[n], cols)
+                if parent_row == row:   # reached horizontally
+                    d_col = 1 if col > parent_col else -1
+                    directions = [(0, d_col), (-1, 0), (1, 0)]
+                else:                   # reached vertically
+                    d_row = 1 if row > parent_row else -1
+                    directions = [(d_row, 0)] + [(0, d_col) for d_col in forcedTurns(row, col, d_row)]
+
+            for d_row, d_col in directions:
+                if d_col == 0:
+                    m = jumpVertical(row, col, d_row)
+                else:
+                    m = jumpHorizontal(row, col, d_col)
+                if m is None:
+                    continue
+                m_row, m_col = divmod(m, cols)
+                g_m = explored[n] + abs(m_row - row) + abs(m_col - col)
+                if explored[m] is None or g_m < explored[m]:
+                    explored[m] = g_m
+                    h_m = abs(m_col - goal_col) + abs(m_row - goal_row)
+                    tie = h_m if tie_break else 0
+                    if indexed and to_explore.contains(m):
+                        to_explore.decreaseKey(m, g_m + h_m, tie)
+                    else:
+                        to_explore.insert(g_m + h_m, m, tie)
+                    num_cells_explored+=1
+                    parents[m] = n
+        else:
+            if track:
+                path_begin = time.perf_counter()
+                stats.record(SearchMetrics("aStar", False, search_begin - setup_begin, path_begin - search_begin,
+                                           0.0, expansions, num_cells_explored + 1, stale_pops, peak_frontier,
+                                           sys.getsizeof(explored) + sys.getsizeof(parents)))
+            return SearchResult(self, parents, num_cells_explored, None)
+
+        # fill in the cells along each straight run between jump points
+        if track: path_begin = time.perf_counter()
+        path_parents = self._cellTable('q', -1)
+        n = goal
+        while parents[n] >= 0:
+            step = 1 if parents[n] > n else -1
+            if parents[n] // cols != n // cols:   # a vertical run
+                step *= cols
+            for cell in range(n, parents[n], step):
+                path_parents[cell] = cell + step
+            n = parents[n]
+        result = SearchResult(self, path_parents, num_cells_explored, goal)
+        if track:
+            stats.record(SearchMetrics("aStar", True, search_begin - setup_begin, path_begin - search_begin,
+                                       time.perf_counter() - path_begin, expansions, num_cells_explored + 1,
+                                       stale_pops, peak_frontier,
+                                       sys.getsizeof(explored) + sys.getsizeof(parents) + sys.getsizeof(path_parents)))
+        return result
+
+    def idaStar(self, table_size: int = _IDA_TABLE_SIZE, stats: SearchStats = None) -> SearchResult:
+        ''' method to perform IDA* (iterative deepening A*): rounds of
+            depth-first search from the start, each cut off wherever f = g + h
+            (g the steps taken, h the Manhattan distance to the goal, or the
+            larger of the row and column distances when moving diagonally)
+            goes over a bound, which starts at h of the start and is raised
+            after each round to the least f that was cut off; only the path
+            being followed and a fixed-size table are kept, so memory grows
+            with the length of the path rather than with the cells explored,
+            but cells are explored again in every round; a goal that cannot
+            be reached is found out once the bound passes the number of open
+            cells, as no path is longer, or once a round cuts nothing off
+        Parameters:
+            table_size: number of slots in a transposition table remembering,
+                        for a cell per slot (the one most recently reached of
+                        those sharing its slot), the fewest steps taken to
+                        reach it over all rounds and the bound of the round
+                        it was last searched in, so that a cell reached in more
+                        steps, or again in as many in the same round, is not
+                        searched again; it takes 16 bytes a slot, and with at
+                        least a slot per open cell reached each round searches
+                        a cell about once; with far fewer, or 0 for no table,
+                        a round may search a cell once per path reaching it
+                        within the bound, which may take exponentially long,
+                        above all when the goal cannot be reached
+            stats:      optional SearchStats to record this search's timings
+                        and counts in, over all rounds; the frontier is the
+                        path being followed
+        Returns:
+            a SearchResult holding a shortest path to the Maze goal (if one
+            can be found) and the number of cells explored over all rounds
+        '''
+        return self._idaStar(*self._endpoints(), table_size, stats)
 
-    def calculatePathLength(self, goal: Cell)->None:
+    def _idaStar(self, start: int, goal: int, table_size: int = _IDA_TABLE_SIZE, stats: SearchStats = None) -> SearchResult:
+        ''' method doing the work of idaStar, between any two cells
+        Parameters:
+            start:      index (row * cols + col) of the cell to search from
+            goal:       index of the cell to search for
+            table_size: as for idaStar
+            stats:      as for idaStar
+        Returns:
+            a SearchResult as for idaStar
+        '''
+        rejected = self._rejectUnreachable(start, goal, "idaStar", stats)
+        if rejected is not None:
+            return rejected
+
+        track = stats is not None
+        if track: setup_begin = time.perf_counter()
+        cols = self._num_cols
+        goal_row, goal_col = divmod(goal, cols)
+
+        # moving diagonally, a step may close both distances at once
+        combine = max if self._search_order in _EIGHT_WAY else int.__add__
+
+        def h(index: int) -> int:
+            row, col = divmod(index, cols)
+            return combine(abs(row - goal_row), abs(col - goal_col))
+
+        # neighbors are worked out per cell rather than read from the
+        # neighbor tables, which are as big as the grid, and are tried
+        # nearest the goal first, so the last round finds the goal early
+        def children(index: int) -> Iterator[int]:
+            return iter(sorted(self._openNeighbors(index), key=h))
+
+        #Use IDA* + a stack of iterators (a path may be far deeper than the
+        #recursion limit):
+        #    path: the cells from the start to the one being searched from,
+        #          so a cell's g is its position on the path
+        #    untried: per cell on the path, the neighbors it has left to try
+        #    on_path: the cells of path, so that it never loops back on itself
+        #    arrays: the transposition table, a cell index, the fewest steps
+        #            it was reached in and the bound of the round it was last
+        #            searched in per slot, the slot of a cell being its index
+        #            modulo table_size; kept over all rounds, since a cell
+        #            reached in more steps than in an earlier round will be
+        #            reached again along that shorter way, within any bound
+        #            as large
+        bound = h(start)
+        num_cells_explored = 0
+        expansions = 0
+        peak_path = 1
+        path = [start]
+        untried: list[Iterator[int]] = []
+        on_path = {start}
+        table_cells, table_steps, table_bounds = array('q'), array('i'), array('i')
+        # a table with a slot per cell never has two cells share a slot
+        table_size = min(table_size, len(self._cells))
+        if table_size:
+            table_cells = array('q', [-1]) * table_size
+            table_steps = array('i', [0]) * table_size
+            table_bounds = array('i', [-1]) * table_size
+        # a shortest path never enters a cell twice, so it takes fewer steps
+        # than there are open cells (counted without a table per cell)
+        max_steps = len(self._cells) - 1 - _countBlocked(self._cells)
+        if track: search_begin = time.perf_counter()
+
+        while start != goal:
+            if bound > max_steps:
+                path = None
+                break
+            path = [start]
+            untried = [children(start)]
+            on_path = {start}
+            next_bound = None
+            expansions += 1
+            while untried:
+                neighbor = next(untried[-1], None)
+                if neighbor is None:
+                    on_path.discard(path.pop())
+                    untried.pop()
+                    continue
+                if neighbor in on_path:
+                    continue
+                g = len(path)
+                if table_size:
+                    slot = neighbor % table_size
+                    if table_cells[slot] == neighbor and (table_steps[slot] < g or
+                                                          table_steps[slot] == g and table_bounds[slot] == bound):
+                        continue
+                f = g + h(neighbor)
+                if f > bound:
+                    if next_bound is None or f < next_bound:
+                        next_bound = f
+                    continue
+                if table_size:
+                    table_cells[slot] = neighbor
+                    table_steps[slot] = g
+                    table_bounds[slot] = bound
+                num_cells_explored += 1
+                path.append(neighbor)
+                if neighbor == goal:
+                    break
+                on_path.add(neighbor)
+                untried.append(children(neighbor))
+                expansions += 1
+                if len(path) > peak_path: peak_path = len(path)
+            else:
+                # every path within the bound was tried; raise it, unless
+                # nothing was cut off, in which case the goal cannot be reached
+                if next_bound is None:
+                    path = None
+                    break
+                bound = next_bound
+                continue
+            break
+
+        if track: path_begin = time.perf_counter()
+        if path is None:
+            result = SearchResult(self, array('q'), num_cells_explored, None)
+        else:
+            parents = {start: -1}
+            for parent, child in zip(path, path[1:]):
+                parents[child] = parent
+            result = SearchResult(self, parents, num_cells_explored, goal)
+        if track:
+            stats.record(SearchMetrics("idaStar", result.isFound(), search_begin - setup_begin,
+                                       path_begin - search_begin, time.perf_counter() - path_begin,
+                                       expansions, num_cells_explored + 1, 0, peak_path,
+                                       sys.getsizeof(untried) + sys.getsizeof(on_path) +
+                                       sys.getsizeof(table_cells) + sys.getsizeof(table_steps) +
+                                       sys.getsizeof(table_bounds) +
+                                       (sys.getsizeof(path) if path is not None else 0)))
+        return result
+
+    def calculatePathLength(self, goal: SearchResult | Cell)->int:
         """method to calculate the path length without printing the maze
 
         Args:
-            goal (Cell): the finish cell
+            goal (SearchResult | Cell): the result of a search, or the finish
+                cell of a chain of Cells linked by parent
+
+        Returns:
+            int: the number of steps from start to goal, 0 if no path was found
         """
+        if isinstance(goal, SearchResult):
+            if not goal.isFound():
+                print("Goal not reachable or not set.")
+            return goal.getPathLength()
 
         cell = goal
         if cell is None or cell._parent is None:
             print("Goal not reachable or not set.")
-            self._path_length = 0
-            return 
+            return 0
         
+        path_length = 0
         while cell._parent:
             cell = cell._parent
-            self._path_length+=1
+            path_length+=1
+        return path_length
         
 
-    def showPath(self, goal: Cell) -> None:
+    def showPath(self, goal: SearchResult | Cell, mark: bool = True) -> None:
         ''' method to update the path from start to goal, identifying the steps
-            along the way as belonging to the path (updating the cell via
-            .markOnPath, which will change that cell's ._contents to
-            Contents.PATH), printing the final resulting solutions
+            along the way as belonging to the path (updating the matching byte
+            of the Maze, and the Cell via .markOnPath unless the Maze is
+            compact, to Contents.PATH), printing the final resulting solutions
         Parameters:
-            goal: a Cell object corresponding to the goal location
+            goal: a SearchResult, or a Cell object corresponding to the goal
+                  location at the end of a chain of Cells linked by parent
+            mark: whether to mark the path on the Maze; if False, the path is
+                  only drawn on what is printed (see render)
         Returns:
             nothing -- just updates the cells in the grid to identify those on the path
         '''
-
-        path = []
-        cell = goal
-        while cell._parent is not None:
-            path.append(cell)
-            cell = cell._parent
-        path.append(cell)  # should be the start
-        assert(cell == self._start)
-
-        path.reverse()  # reverse the list
-
-        for cell in path:
-            if cell != self._start and cell != self._goal:
-                cell.markOnPath()
-
-        # print the maze, i.e., using __str__ which will show the solved maze
-        print(self)
+        if isinstance(goal, SearchResult):
+            path = goal.getPath()
+        else:
+            path = []
+            cell = goal
+            while cell._parent is not None:
+                path.append(cell.getPosition())
+                cell = cell._parent
+            path.append(cell.getPosition())  # should be the start
+            assert(cell == self._start)
+
+            path.reverse()  # reverse the list
+
+        if not mark:
+            self.render(path = path)
+            return
+        for position in path:
+            if position != self._start._position and position != self._goal._position:
+                self._cells[self._index(position)] = _CODE[Contents.PATH]
+                if self._grid is not None:
+                    self._grid[position.row][position.col].markOnPath()
+
+        # print the maze, a row at a time, which will show the solved maze
+        self.render()
+
+# the Maze each worker process of Maze.solveMany searches, set once per process
+_solver_maze: Maze | None = None
+
+def _setSolverMaze(maze: Maze) -> None:
+    global _solver_maze
+    _solver_maze = maze
+
+def _solveQuery(query: tuple[int, int, str]) -> QueryResult:
+    return _solver_maze._answer(*query)
+
+def _mapInChunks(pool: ProcessPoolExecutor, func: Callable, items: list, workers: int) -> list:
+    ''' function to run func on every item over a pool of worker processes,
+        handing the items out in chunks so each process gets a few at a time
+        (fewer round trips than one at a time, while still sharing the work out)
+    Parameters:
+        pool:    the pool to run func in
+        func:    a picklable function of one item
+        items:   the items to run func on
+        workers: number of processes in the pool
+    Returns:
+        the results, in the same order as items
+    '''
+    return list(pool.map(func, items, chunksize=max(1, len(items) // (workers * 8))))
 
 ##############################################################################################################################################################################
 def main() -> None:
@@ -521,21 +2430,18 @@ def word()->None:
 def checkingCases()->None:
     random.seed(3520051)
     m = Maze(50,50, prop_blocked=0.25, search_order=SearchOrder.NSWE)
-    goal = m.bfs()
-    m.calculatePathLength(goal)
-    m.showPath(goal)
-    print(f"BFS: cells explored = {m._num_cells_explored} and path length = {m._path_length}")
+    result = m.bfs()
+    m.showPath(result)
+    print(f"BFS: {result}")
 
     random.seed(3520051)
     a = Maze(50,50, prop_blocked=0.25, search_order=SearchOrder.NSWE)
-    goal = a.dfs()
-    a.calculatePathLength(goal)
-    a.showPath(goal)
+    result = a.dfs()
+    a.showPath(result)
 
     d = Maze(50,50, prop_blocked=0.25, search_order=SearchOrder.NSWE)
-    goal = d.aStar()
-    d.calculatePathLength(goal)
-    print(f"aStar: cells explored = {d._num_cells_explored} and path length = {d._path_length}")
+    result = d.aStar()
+    print(f"aStar: {result}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
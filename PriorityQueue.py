@@ -10,11 +10,13 @@ class EmptyError(Exception):
         self.message = message
 #################
 class Entry[K,V]:
-    __slots__ = ('key', 'value')
+    __slots__ = ('key', 'value', 'tie', 'order')
 
-    def __init__(self, priority: K, data: V) -> None:
+    def __init__(self, priority: K, data: V, tie: int = 0, order: int = 0) -> None:
         self.key  : K = priority
         self.value: V = data
+        self.tie  : int = tie     # compared when keys are equal (lower first)
+        self.order: int = order   # insertion count, compared when ties are equal too
 
     def __str__(self) -> str:
         return f"({self.key},{self.value})"
@@ -23,7 +25,11 @@ class Entry[K,V]:
         return self.key == other.key and self.value == other.value
 
     def __lt__(self, other: Entry[K,V]) -> bool:
-        return self.key < other.key
+        if self.key != other.key:
+            return self.key < other.key
+        if self.tie != other.tie:
+            return self.tie < other.tie
+        return self.order < other.order
 
     # not the Pythonic way to use __repr__ but allows us to print a list of Entry
     def __repr__(self) -> str: 
@@ -31,25 +37,33 @@ class Entry[K,V]:
 
 #######################
 class PriorityQueue[K,V]:
-    __slots__ = ('_container')
+    __slots__ = ('_container', '_num_inserts', '_num_pops', '_max_size')
 
     def __init__(self) -> None:
         self._container: list[Entry[K,V]] = list()
+        self._num_inserts: int = 0
+        self._num_pops:    int = 0
+        self._max_size:    int = 0
 
     def __len__(self)  -> int:  return len(self._container)
     def isEmpty(self) -> bool:  return len(self._container) == 0
 
-    def insert(self, key: K, item: V) -> None: 
-        """_summary_ inserts a new item in the proper position for the priority q. Follows min heap rules
+    def insert(self, key: K, item: V, tie: int = 0) -> None:
+        """_summary_ inserts a new item in the proper position for the priority q. Follows min heap rules;
+        items with equal keys come out in order of tie, then in the order they were inserted
 
         Args:
             key (K): value of item we are inserting
             item (V): item we are inserting
+            tie (int): secondary key for items with equal keys (lower first)
         """
         # create a new Entry having key, item
 		# insert into the heap (self._container) using heapq.heappush
-        entryPushed = Entry(key, item)
+        entryPushed = Entry(key, item, tie, self._num_inserts)
         heapq.heappush(self._container, entryPushed)
+        self._num_inserts += 1
+        if len(self._container) > self._max_size:
+            self._max_size = len(self._container)
 
     def removeMin(self) -> Entry[K,V]:
         """_summary_ removes the min item of the priority q. in a heap it is the first item of the list
@@ -64,6 +78,7 @@ class PriorityQueue[K,V]:
         if self.isEmpty():
             raise EmptyError("The queue is empty we cannot remove anything")
         else: 
+            self._num_pops += 1
             return heapq.heappop(self._container)
 
     def min(self) -> Entry[K,V]:
@@ -79,9 +94,301 @@ class PriorityQueue[K,V]:
             raise EmptyError("The queue is empty we cannot remove anything")
         else: return self._container[0]
 
+    def getStats(self) -> dict[str, int]:
+        """_summary_ counts of what has happened to the queue so far
+
+        Returns:
+            dict[str, int]: number of inserts, number of pops, and the largest size the heap reached
+        """
+        return {"inserts": self._num_inserts, "pops": self._num_pops, "max_size": self._max_size}
+
+    def __str__(self) -> str:
+        return str(self._container)
+
+#######################
+class IndexedPriorityQueue[K,V]:
+    """_summary_ a min heap that also keeps a map from each item to its slot in the heap,
+    so an item can be found, have its key lowered, or be removed without searching the
+    heap; each item can be in the queue at most once (items must be hashable)
+    """
+    __slots__ = ('_container', '_positions', '_num_inserts', '_num_pops', '_num_decreases', '_max_size')
+
+    def __init__(self) -> None:
+        self._container: list[Entry[K,V]] = list()
+        self._positions: dict[V, int]     = dict()
+        self._num_inserts:   int = 0
+        self._num_pops:      int = 0
+        self._num_decreases: int = 0
+        self._max_size:      int = 0
+
+    def __len__(self)  -> int:  return len(self._container)
+    def isEmpty(self) -> bool:  return len(self._container) == 0
+
+    def contains(self, item: V) -> bool:
+        """_summary_ checks whether an item is in the queue
+
+        Args:
+            item (V): item to look for
+
+        Returns:
+            bool: True if the item is in the queue
+        """
+        return item in self._positions
+
+    def insert(self, key: K, item: V, tie: int = 0) -> None:
+        """_summary_ inserts a new item in the proper position for the priority q. Follows min heap rules;
+        items with equal keys come out in order of tie, then in the order they were inserted
+
+        Args:
+            key (K): value of item we are inserting
+            item (V): item we are inserting
+            tie (int): secondary key for items with equal keys (lower first)
+
+        Raises:
+            ValueError: if the item is already in the queue (use decreaseKey instead)
+        """
+        if item in self._positions:
+            raise ValueError(f"{item} is already in the queue")
+        self._container.append(Entry(key, item, tie, self._num_inserts))
+        self._positions[item] = len(self._container) - 1
+        self._siftUp(len(self._container) - 1)
+        self._num_inserts += 1
+        if len(self._container) > self._max_size:
+            self._max_size = len(self._container)
+
+    def decreaseKey(self, item: V, key: K, tie: int = 0) -> None:
+        """_summary_ lowers the key of an item already in the queue and moves it up the heap
+
+        Args:
+            item (V): item whose key is changing
+            key (K): its new key
+            tie (int): its new secondary key
+
+        Raises:
+            KeyError: if the item is not in the queue
+            ValueError: if the new key is larger than the current one
+        """
+        slot = self._positions[item]
+        if self._container[slot].key < key:
+            raise ValueError(f"new key {key} is larger than current key {self._container[slot].key}")
+        self._container[slot].key = key
+        self._container[slot].tie = tie
+        self._siftUp(slot)
+        self._siftDown(self._positions[item])
+        self._num_decreases += 1
+
+    def removeMin(self) -> Entry[K,V]:
+        """_summary_ removes the min item of the priority q. in a heap it is the first item of the list
+
+        Raises:
+            EmptyError: if the list is empty is can't remove anything and raises an empty error
+
+        Returns:
+            Entry[K,V]: returns the entry at the min position
+        """
+        if self.isEmpty():
+            raise EmptyError("The queue is empty we cannot remove anything")
+        self._num_pops += 1
+        return self._removeAt(0)
+
+    def remove(self, item: V) -> Entry[K,V]:
+        """_summary_ removes an item from anywhere in the queue
+
+        Args:
+            item (V): item to remove
+
+        Raises:
+            KeyError: if the item is not in the queue
+
+        Returns:
+            Entry[K,V]: the entry that held the item
+        """
+        return self._removeAt(self._positions[item])
+
+    def min(self) -> Entry[K,V]:
+        """_summary_ returns the min item of the priority q without removing it
+
+        Raises:
+            EmptyError: raises error if the list is empty
+
+        Returns:
+            Entry[K,V]: the min item
+        """
+        if self.isEmpty():
+            raise EmptyError("The queue is empty we cannot remove anything")
+        else: return self._container[0]
+
+    def getStats(self) -> dict[str, int]:
+        """_summary_ counts of what has happened to the queue so far
+
+        Returns:
+            dict[str, int]: number of inserts, pops and key decreases, and the largest size the heap reached
+        """
+        return {"inserts": self._num_inserts, "pops": self._num_pops,
+                "decreases": self._num_decreases, "max_size": self._max_size}
+
+    def _removeAt(self, slot: int) -> Entry[K,V]:
+        # swap the last entry into the emptied slot, then restore heap order
+        # by moving it whichever way it needs to go
+        removed = self._container[slot]
+        last = self._container.pop()
+        del self._positions[removed.value]
+        if slot < len(self._container):
+            self._container[slot] = last
+            self._positions[last.value] = slot
+            self._siftUp(slot)
+            self._siftDown(self._positions[last.value])
+        return removed
+
+    def _siftUp(self, slot: int) -> None:
+        container, positions = self._container, self._positions
+        entry = container[slot]
+        while slot > 0:
+            parent = (slot - 1) // 2
+            if not entry < container[parent]:
+                break
+            container[slot] = container[parent]
+            positions[container[slot].value] = slot
+            slot = parent
+        container[slot] = entry
+        positions[entry.value] = slot
+
+    def _siftDown(self, slot: int) -> None:
+        container, positions = self._container, self._positions
+        entry = container[slot]
+        size = len(container)
+        while 2 * slot + 1 < size:
+            child = 2 * slot + 1
+            if child + 1 < size and container[child + 1] < container[child]:
+                child += 1
+            if not container[child] < entry:
+                break
+            container[slot] = container[child]
+            positions[container[slot].value] = slot
+            slot = child
+        container[slot] = entry
+        positions[entry.value] = slot
+
     def __str__(self) -> str:
         return str(self._container)
 
+#######################
+class BucketQueue[V]:
+    """_summary_ a priority queue for non-negative int keys spanning a small range (Dial's
+    algorithm): one bucket per key value that has entries, holding a list of entries per tie
+    value that has any and a heap of those tie values, plus a cursor at the lowest key that
+    may have entries, so insert is O(1) (O(log t) for a new tie among t) and removeMin only
+    moves the cursor forward past keys with no entries, or, once it has passed as many as
+    there are keys with entries, jumps to the least of those; buckets are kept by key and
+    dropped once emptied, so memory grows with the entries held, however far apart the keys,
+    and removeMin is fastest when the keys held are close together; entries with equal keys
+    and ties come out last-in, first-out
+    """
+    __slots__ = ('_buckets', '_tie_heaps', '_cursor', '_size', '_num_inserts', '_num_pops', '_max_size')
+
+    def __init__(self) -> None:
+        self._buckets:     dict[int, dict[int, list[Entry[int,V]]]] = dict()   # [key][tie] -> entries
+        self._tie_heaps:   dict[int, list[int]] = dict()   # per key with entries, a heap of its ties
+        self._cursor:      int = 0              # no entry has a key below this
+        self._size:        int = 0
+        self._num_inserts: int = 0
+        self._num_pops:    int = 0
+        self._max_size:    int = 0
+
+    def __len__(self)  -> int:  return self._size
+    def isEmpty(self) -> bool:  return self._size == 0
+
+    def insert(self, key: int, item: V, tie: int = 0) -> None:
+        """_summary_ adds an item to the bucket for its key and tie
+
+        Args:
+            key (int): priority of the item, a non-negative int
+            item (V): item we are inserting
+            tie (int): secondary key for items with equal keys (lower first), a non-negative int
+
+        Raises:
+            ValueError: if key or tie is negative
+        """
+        if key < 0 or tie < 0:
+            raise ValueError(f"keys and ties must be non-negative, not {key} and {tie}")
+        ties = self._buckets.get(key)
+        if ties is None:
+            ties = self._buckets[key] = dict()
+            self._tie_heaps[key] = list()
+        entries = ties.get(tie)
+        if entries is None:
+            entries = ties[tie] = list()
+            heapq.heappush(self._tie_heaps[key], tie)
+        entries.append(Entry(key, item, tie))
+        if key < self._cursor:
+            self._cursor = key
+        self._size += 1
+        self._num_inserts += 1
+        if self._size > self._max_size:
+            self._max_size = self._size
+
+    def removeMin(self) -> Entry[int,V]:
+        """_summary_ removes an item with the smallest key (and smallest tie among those)
+
+        Raises:
+            EmptyError: if the queue is empty
+
+        Returns:
+            Entry[int,V]: the removed entry
+        """
+        if self.isEmpty():
+            raise EmptyError("The queue is empty we cannot remove anything")
+        bucket = self._firstBucket()
+        entry = bucket.pop()
+        if not bucket:
+            # drop the emptied tie, and the emptied key, so only those with entries are kept
+            ties = self._tie_heaps[self._cursor]
+            heapq.heappop(ties)
+            if ties:
+                del self._buckets[self._cursor][entry.tie]
+            else:
+                del self._buckets[self._cursor], self._tie_heaps[self._cursor]
+        self._size -= 1
+        self._num_pops += 1
+        return entry
+
+    def min(self) -> Entry[int,V]:
+        """_summary_ returns an item with the smallest key without removing it
+
+        Raises:
+            EmptyError: if the queue is empty
+
+        Returns:
+            Entry[int,V]: the entry that removeMin would return
+        """
+        if self.isEmpty():
+            raise EmptyError("The queue is empty we cannot remove anything")
+        return self._firstBucket()[-1]
+
+    def getStats(self) -> dict[str, int]:
+        """_summary_ counts of what has happened to the queue so far
+
+        Returns:
+            dict[str, int]: number of inserts, number of pops, and the largest size the queue reached
+        """
+        return {"inserts": self._num_inserts, "pops": self._num_pops, "max_size": self._max_size}
+
+    def _firstBucket(self) -> list[Entry[int,V]]:
+        # only called when the queue is not empty
+        if self._cursor not in self._tie_heaps:
+            cursor, last = self._cursor + 1, self._cursor + len(self._tie_heaps)
+            while cursor not in self._tie_heaps:
+                if cursor == last:
+                    cursor = min(self._tie_heaps)
+                    break
+                cursor += 1
+            self._cursor = cursor
+        return self._buckets[self._cursor][self._tie_heaps[self._cursor][0]]
+
+    def __str__(self) -> str:
+        return str([entry for key in sorted(self._buckets) for tie in sorted(self._buckets[key])
+                    for entry in reversed(self._buckets[key][tie])])
+
 ##########################
 def main() -> None:
     pq = PriorityQueue()
@@ -104,6 +411,25 @@ def main() -> None:
         print(l.removeMin())
         print(l)
 
+    ipq = IndexedPriorityQueue() #tests the indexed heap: decreaseKey and remove by item
+    for key, name in [(40, "a"), (30, "b"), (20, "c"), (10, "d")]:
+        ipq.insert(key, name)
+    ipq.decreaseKey("a", 5)
+    print(ipq.min())
+    print(ipq.remove("c"))
+    print(ipq.contains("c"))
+    while not ipq.isEmpty():
+        print(ipq.removeMin())
+    print(ipq.getStats())
+
+    bq = BucketQueue() #tests the bucket queue with small int keys
+    for key in [7, 3, 9, 3, 0]:
+        bq.insert(key, f"item{key}")
+    print(bq)
+    while not bq.isEmpty():
+        print(bq.removeMin())
+    print(bq.getStats())
+
 
 
 
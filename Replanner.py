@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from math import inf
+
+from Maze import *
+from Maze import _BLOCKED, _EIGHT_WAY
+from Components import gridNeighbors
+
+class DStarLite:
+    """_summary_ incremental shortest-path planner for a Maze whose cells are blocked and
+    cleared between queries (D* Lite, Koenig & Likhachev): it searches backward from the
+    goal, keeping for every cell g (the distance to the goal it last settled on) and rhs
+    (the one-step lookahead min over its neighbors of 1 + g), and only cells where the two
+    disagree go in the priority queue; after cells change, just those cells and their
+    neighbors are re-checked, and the repair spreads no further than the distances that
+    actually changed. Because the search runs from the goal, the start may also move
+    between queries. Every move costs 1, so the planner is not for a Maze with costs (see
+    Maze.setCosts), nor one that moves diagonally.
+    """
+    __slots__ = ('_maze', '_rows', '_cols', '_start', '_goal', '_g', '_rhs', '_queue', '_km',
+                 '_num_expansions')
+
+    def __init__(self, maze: Maze, start: Position = None) -> None:
+        """_summary_ sets up the planner; the first path is found by the first call of plan
+
+        Args:
+            maze (Maze): the maze to plan on (its cells are changed through replan)
+            start (Position): where to plan from (the Maze start if not given); the goal is
+                always the Maze goal
+
+        Raises:
+            ValueError: if the Maze moves diagonally (the planner only moves in four directions)
+            ValueError: if the Maze has costs (the planner takes every move to cost 1)
+        """
+        if maze._search_order in _EIGHT_WAY:
+            raise ValueError("DStarLite only moves in four directions")
+        if maze._costs is not None:
+            raise ValueError("DStarLite needs every move to cost the same")
+        self._maze: Maze = maze
+        self._rows: int = maze._num_rows
+        self._cols: int = maze._num_cols
+        self._start: int = maze._checkedIndex(maze.getStart().getPosition() if start is None else start)
+        self._goal: int = maze._index(maze.getGoal().getPosition())
+        self._g:   list[float] = [inf] * (self._rows * self._cols)
+        self._rhs: list[float] = [inf] * (self._rows * self._cols)
+        self._queue: IndexedPriorityQueue[tuple[float, float], int] = IndexedPriorityQueue()
+        self._km: int = 0                 # grows as the start moves, instead of re-keying the queue
+        self._num_expansions: int = 0     # cells expanded by the latest plan or replan
+
+        self._rhs[self._goal] = 0
+        self._queue.insert(self._key(self._goal), self._goal)
+
+    def plan(self) -> SearchResult:
+        """_summary_ brings the distances up to date (a full backward A* the first time) and
+        reads the path off them
+
+        Returns:
+            SearchResult: the path from the start to the Maze goal, if there is one; the cells
+            explored are the cells expanded by this call
+        """
+        self._num_expansions = 0
+        self._computeShortestPath()
+        return self._path()
+
+    def replan(self, toggled: Sequence[Position] = (), start: Position = None) -> SearchResult:
+        """_summary_ blocks every given cell that is open and clears every one that is blocked
+        (via Maze.setBlocked), optionally moves the start, then repairs the distances the
+        changes affect and reads the new path off them
+
+        Args:
+            toggled (Sequence[Position]): cells whose blocked state flips
+            start (Position): new start to plan from (unchanged if not given)
+
+        Raises:
+            ValueError: if a cell is out of range or is the Maze start or goal (see
+                Maze.setBlocked), or if start is out of range
+
+        Returns:
+            SearchResult: as for plan
+        """
+        maze = self._maze
+        if start is not None:
+            start = maze._checkedIndex(start)
+            self._km += self._heuristic(self._start, start)
+            self._start = start
+
+        for position in toggled:
+            index = maze._checkedIndex(position)
+            maze.setBlocked(position, maze._cells[index] != _BLOCKED)
+            # every edge touching the cell changed cost, so the cell and all of
+            # its neighbors may have a different lookahead now
+            self._updateCell(index)
+            for neighbor in gridNeighbors(index, self._rows, self._cols):
+                self._updateCell(neighbor)
+        return self.plan()
+
+    def getDistance(self) -> int | None:
+        """_summary_ the number of steps from the start to the goal as of the latest plan
+
+        Returns:
+            int | None: the distance, or None if the goal cannot be reached
+        """
+        # the search stops once the start's lookahead is settled, which may
+        # be before its own g has been brought down to match
+        distance = self._rhs[self._start]
+        return None if distance == inf else distance
+
+    def getNumExpansions(self) -> int:
+        """_summary_ how much work the latest plan or replan did
+
+        Returns:
+            int: the number of cells taken off the priority queue
+        """
+        return self._num_expansions
+
+    def _heuristic(self, first: int, second: int) -> int:
+        first_row, first_col = divmod(first, self._cols)
+        second_row, second_col = divmod(second, self._cols)
+        return abs(first_row - second_row) + abs(first_col - second_col)
+
+    def _key(self, index: int) -> tuple[float, float]:
+        best = min(self._g[index], self._rhs[index])
+        return (best + self._heuristic(self._start, index) + self._km, best)
+
+    def _lookahead(self, index: int) -> float:
+        cells, g = self._maze._cells, self._g
+        if cells[index] == _BLOCKED:
+            return inf
+        # a step into or out of a blocked cell costs infinity
+        return min((g[neighbor] for neighbor in gridNeighbors(index, self._rows, self._cols)
+                    if cells[neighbor] != _BLOCKED),
+                   default=inf) + 1
+
+    def _updateCell(self, index: int) -> None:
+        if index != self._goal:
+            self._rhs[index] = self._lookahead(index)
+        if self._queue.contains(index):
+            self._queue.remove(index)
+        if self._g[index] != self._rhs[index]:
+            self._queue.insert(self._key(index), index)
+
+    def _computeShortestPath(self) -> None:
+        queue, g, rhs, start = self._queue, self._g, self._rhs, self._start
+        while not queue.isEmpty() and (queue.min().key < self._key(start) or rhs[start] > g[start]):
+            old_key = queue.min().key
+            index = queue.removeMin().value
+            self._num_expansions += 1
+            new_key = self._key(index)
+            if old_key < new_key:
+                # keyed before the start moved; put it back with its current key
+                queue.insert(new_key, index)
+            elif g[index] > rhs[index]:
+                g[index] = rhs[index]
+                for neighbor in gridNeighbors(index, self._rows, self._cols):
+                    self._updateCell(neighbor)
+            else:
+                g[index] = inf
+                self._updateCell(index)
+                for neighbor in gridNeighbors(index, self._rows, self._cols):
+                    self._updateCell(neighbor)
+
+    def _path(self) -> SearchResult:
+        maze, g = self._maze, self._g
+        if self._rhs[self._start] == inf:
+            return SearchResult(maze, array('q'), self._num_expansions, None)
+        # step to the open neighbor closest to the goal until it is reached
+        parents = {self._start: -1}
+        current = self._start
+        while current != self._goal:
+            following = min((neighbor for neighbor in gridNeighbors(current, self._rows, self._cols)
+                             if maze._cells[neighbor] != _BLOCKED), key=g.__getitem__)
+            parents[following] = current
+            current = following
+        return SearchResult(maze, parents, self._num_expansions, self._goal)
+
+def main() -> None:
+    rng = random.Random(8675309)
+    m = Maze(60, 60, prop_blocked=0.2, compact=True, rng=random.Random(2))
+    planner = DStarLite(m)
+    result = planner.plan()
+    print(f"first plan: {result}, {planner.getNumExpansions()} expansions (aStar: {m.aStar()})")
+    for _ in range(5):
+        # block a cell on the current path, and flip two others anywhere
+        path = result.getPath()
+        toggled = [path[rng.randrange(1, len(path) - 1)]] + \
+                  [Position(rng.randrange(60), rng.randrange(60)) for _ in range(2)]
+        toggled = [p for p in toggled if p not in (m.getStart().getPosition(), m.getGoal().getPosition())]
+        result = planner.replan(toggled)
+        print(f"after toggling {', '.join(str(p) for p in toggled)}: {result}, "
+              f"{planner.getNumExpansions()} expansions (aStar: {m.aStar()})")
+        if not result.isFound():
+            break
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+# numpy is only needed for fast maze generation and for generating maze files,
+# so the rest of the package still works (and imports this module) without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def blockRandomCells(cells: bytearray, excluded: tuple[int, ...], count: int, blocked: int, seed: int) -> None:
+    """_summary_ blocks count cells of a grid, chosen uniformly at random without replacement
+    from all cells but the excluded ones, using numpy's generator to pick them and one
+    scatter to write them; the same seed always blocks the same cells, but not the cells
+    random.sample would pick
+
+    Args:
+        cells (bytearray): one byte per cell, row-major (e.g. a Maze's bytearray), changed in place
+        excluded (tuple[int, ...]): distinct indices of cells never to block (e.g. start and goal)
+        count (int): number of cells to block
+        blocked (int): the byte value marking a blocked cell
+        seed (int): seed for numpy's random generator
+
+    Raises:
+        ImportError: if numpy is not installed
+    """
+    if np is None:
+        raise ImportError("fast maze generation needs numpy installed")
+    picks = np.random.default_rng(seed).choice(len(cells) - len(excluded), size=count, replace=False)
+    # the picks index the cells that are left once the excluded ones are taken
+    # out; step each one past every excluded cell at or before it
+    for index in sorted(excluded):
+        picks += picks >= index
+    np.frombuffer(cells, dtype=np.uint8)[picks] = blocked
+
+def writeRandomBits(file, count: int, probability: float, seed: int, chunk: int = 1 << 22) -> None:
+    """_summary_ writes count random bits, each set with the given probability, packed eight
+    to a byte, most significant bit first (the last byte padded with zeros), generating and
+    writing them a chunk at a time so that any number of bits can be written in bounded memory
+
+    Args:
+        file: binary file open for writing, positioned where the bits go
+        count (int): number of bits to write
+        probability (float): chance of each bit being set
+        seed (int): seed for numpy's random generator
+        chunk (int): number of bits made at once, a multiple of 8
+
+    Raises:
+        ImportError: if numpy is not installed
+    """
+    if np is None:
+        raise ImportError("generating a maze file needs numpy installed")
+    rng = np.random.default_rng(seed)
+    for begin in range(0, count, chunk):
+        file.write(np.packbits(rng.random(min(chunk, count - begin)) < probability).tobytes())
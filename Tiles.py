@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import mmap
+
+class TiledCells:
+    """_summary_ the cells of a grid too big to hold in memory, read from a file storing one
+    bit per cell (set if blocked), row-major, most significant bit first: the grid is split
+    into square tiles that are read from the memory-mapped file when first needed and kept
+    one bit per cell, and only as many tiles as fit in the cache budget are kept, the least
+    recently used being dropped first
+
+    Indexing by row-major cell index reads and writes the same one-byte codes a Maze stores
+    per cell. Only whether a cell is blocked lives in the tiles; the few cells with any other
+    code (the start, goal and path) are kept aside. Changes never reach the file: a tile in
+    which a cell has been blocked or cleared is kept in memory from then on, outside the budget.
+    """
+    __slots__ = ('_path', '_offset', '_rows', '_cols', '_blocked', '_empty', '_tile_size', '_shift',
+                 '_mask', '_tiles_across', '_capacity', '_data', '_cache', '_edited', '_marks',
+                 '_last_key', '_last_tile', '_num_loads')
+
+    def __init__(self, path: str, offset: int, rows: int, cols: int, blocked: int, empty: int,
+                 tile_size: int = 256, cache_bytes: int = 64 << 20) -> None:
+        """_summary_ maps the file; no tile is read until a cell in it is
+
+        Args:
+            path (str): name of the file holding the grid
+            offset (int): byte offset of the grid within the file
+            rows (int): number of rows in the grid
+            cols (int): number of columns in the grid
+            blocked (int): the code read for a blocked cell
+            empty (int): the code read for an open cell with no other code set
+            tile_size (int): side length of a tile in cells, a power of two of at least 8
+            cache_bytes (int): how much memory the cached tiles may use (at least one tile is
+                always kept)
+
+        Raises:
+            ValueError: if tile_size is not a power of two of at least 8
+            OSError: if the file cannot be opened
+        """
+        if tile_size < 8 or tile_size & (tile_size - 1):
+            raise ValueError("tile_size must be a power of two of at least 8")
+        self._path: str = path
+        self._offset: int = offset
+        self._rows: int = rows
+        self._cols: int = cols
+        self._blocked: int = blocked
+        self._empty: int = empty
+        self._tile_size: int = tile_size
+        self._shift: int = tile_size.bit_length() - 1
+        self._mask: int = tile_size - 1
+        self._tiles_across: int = (cols + tile_size - 1) // tile_size
+        self._capacity: int = max(1, cache_bytes // (tile_size * tile_size // 8))
+        with open(path, 'rb') as f:
+            self._data: mmap.mmap = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+        self._cache: dict[int, bytearray] = {}    # tile key -> bits, most recently used last
+        self._edited: dict[int, bytearray] = {}   # tiles that have been changed, never dropped
+        self._marks: dict[int, int] = {}          # cell index -> code, for codes other than blocked/empty
+        self._last_key: int = -1                  # the tile read most recently, to skip the lookup
+        self._last_tile: bytearray | None = None
+        self._num_loads: int = 0
+
+    def __getstate__(self) -> dict:
+        # the mapping cannot be pickled, so the file is mapped again on unpickling
+        state = {name: getattr(self, name) for name in self.__slots__}
+        del state['_data']
+        state['_cache'], state['_last_key'], state['_last_tile'] = {}, -1, None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        with open(self._path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+
+    def __len__(self) -> int: return self._rows * self._cols
+
+    def __getitem__(self, index: int | slice) -> int | bytes:
+        if type(index) is slice:
+            return bytes(self[i] for i in range(*index.indices(len(self))))
+        row, col = divmod(index, self._cols)
+        if row >= self._rows or index < 0:
+            raise IndexError("cell index out of range")
+        key = (row >> self._shift) * self._tiles_across + (col >> self._shift)
+        tile = self._last_tile if key == self._last_key else self._tile(key)
+        bit = ((row & self._mask) << self._shift) | (col & self._mask)
+        if tile[bit >> 3] & (0x80 >> (bit & 7)):
+            return self._blocked
+        return self._marks.get(index, self._empty)
+
+    def __setitem__(self, index: int, code: int) -> None:
+        row, col = divmod(index, self._cols)
+        if row >= self._rows or index < 0:
+            raise IndexError("cell index out of range")
+        key = (row >> self._shift) * self._tiles_across + (col >> self._shift)
+        bit = ((row & self._mask) << self._shift) | (col & self._mask)
+        flag = 0x80 >> (bit & 7)
+        tile = self._tile(key)
+        if bool(tile[bit >> 3] & flag) != (code == self._blocked):
+            # keep the changed tile for good, since it can no longer be read back from the file
+            self._edited[key] = self._cache.pop(key, tile)
+            tile[bit >> 3] ^= flag
+        if code == self._blocked or code == self._empty:
+            self._marks.pop(index, None)
+        else:
+            self._marks[index] = code
+
+    def getNumTileLoads(self) -> int:
+        """_summary_ how many times a tile has been read from the file, counting tiles read
+        again after being dropped from the cache
+
+        Returns:
+            int: the number of tile reads so far
+        """
+        return self._num_loads
+
+    def getCacheBytes(self) -> int:
+        """_summary_ the memory the tiles in memory take up now
+
+        Returns:
+            int: bytes of tile bits held, in the cache and in changed tiles
+        """
+        return (len(self._cache) + len(self._edited)) * (self._tile_size * self._tile_size // 8)
+
+    def countBlocked(self) -> int:
+        """_summary_ counts the blocked cells by scanning the file a megabyte at a time, then
+        correcting for the tiles that have been changed, so no tile is read into the cache
+
+        Returns:
+            int: the number of blocked cells in the grid
+        """
+        data, offset = self._data, self._offset
+        end = offset + (self._rows * self._cols + 7) // 8
+        blocked = sum(int.from_bytes(data[at : min(at + (1 << 20), end)], 'big').bit_count()
+                      for at in range(offset, end, 1 << 20))
+        for key, tile in self._edited.items():
+            blocked += int.from_bytes(tile, 'big').bit_count() - \
+                       int.from_bytes(self._fileTile(key), 'big').bit_count()
+        return blocked
+
+    def _tile(self, key: int) -> bytearray:
+        tile = self._edited.get(key)
+        if tile is None:
+            tile = self._cache.pop(key, None)
+            if tile is None:
+                tile = self._readTile(key)
+                if len(self._cache) >= self._capacity:
+                    del self._cache[next(iter(self._cache))]
+            self._cache[key] = tile
+        self._last_key, self._last_tile = key, tile
+        return tile
+
+    def _readTile(self, key: int) -> bytearray:
+        """_summary_ copies one tile's bits out of the file, a row of the tile at a time; a
+        tile row need not start on a byte boundary of the file, so the bytes around it are
+        read as one int and shifted into place
+
+        Args:
+            key (int): the tile's number, row-major over the tiles
+
+        Returns:
+            bytearray: the tile's bits, row-major, each row padded to the tile size
+        """
+        self._num_loads += 1
+        return self._fileTile(key)
+
+    def _fileTile(self, key: int) -> bytearray:
+        """_summary_ does the work of _readTile without counting the read
+
+        Args:
+            key (int): the tile's number, row-major over the tiles
+
+        Returns:
+            bytearray: the tile's bits as stored in the file
+        """
+        size, cols = self._tile_size, self._cols
+        tile_row, tile_col = divmod(key, self._tiles_across)
+        first_row, first_col = tile_row * size, tile_col * size
+        width = min(size, cols - first_col)
+        row_bytes = size // 8
+        tile = bytearray(size * row_bytes)
+        data, offset = self._data, self._offset
+        for r in range(min(size, self._rows - first_row)):
+            start = (first_row + r) * cols + first_col
+            low, high = start >> 3, (start + width + 7) >> 3
+            bits = int.from_bytes(data[offset + low : offset + high], 'big')
+            bits = bits >> ((high << 3) - start - width) & ((1 << width) - 1)
+            tile[r * row_bytes : (r + 1) * row_bytes] = (bits << (size - width)).to_bytes(row_bytes, 'big')
+        return tile
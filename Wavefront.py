@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+# numpy is only needed for the vectorized search, so the rest of the package
+# still works (and imports this module) without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def wavefrontDistances(cells, rows: int, cols: int, start: int, goal: int, blocked: int) -> tuple[np.ndarray, int]:
+    """_summary_ breadth-first search that expands a whole BFS layer per step with numpy
+    array operations: the frontier is an array of row-major cell indices, its four
+    neighbor shifts are gathered at once, and the ones that are open and not yet
+    reached become the next layer. Stops once the goal has been reached.
+
+    Args:
+        cells: one byte per cell, row-major (e.g. a Maze's bytearray)
+        rows (int): number of rows in the grid
+        cols (int): number of columns in the grid
+        start (int): index of the start cell
+        goal (int): index of the goal cell
+        blocked (int): the byte value marking a blocked cell
+
+    Raises:
+        ImportError: if numpy is not installed
+
+    Returns:
+        tuple[np.ndarray, int]: the BFS distance of every cell from start (-1 where
+        not reached) and the number of cells reached besides the start
+    """
+    if np is None:
+        raise ImportError("the vectorized search needs numpy installed")
+
+    # work on a copy of the grid padded with a one-cell blocked border, so
+    # that the four neighbor shifts never need bounds checks
+    width = cols + 2
+    grid = np.frombuffer(cells, dtype=np.uint8, count=rows * cols).reshape(rows, cols)
+    free = np.zeros((rows + 2, width), dtype=bool)
+    free[1:-1, 1:-1] = grid != blocked
+    free = free.ravel()          # open and not yet reached
+    distances = np.full(free.size, -1, dtype=np.int32)
+    owner = np.empty(free.size, dtype=np.int64)  # scratch space for removing duplicates
+    shifts = np.array([-width, width, -1, 1], dtype=np.int64)
+
+    def padded(index: int) -> int: return (index // cols + 1) * width + index % cols + 1
+    start, goal = padded(start), padded(goal)
+    distances[start] = 0
+    free[start] = False
+    frontier = np.array([start], dtype=np.int64)
+    reached = 0
+    layer = 0
+    while frontier.size > 0 and distances[goal] < 0:
+        layer += 1
+        candidates = (frontier[:, None] + shifts).ravel()
+        candidates = candidates[free[candidates]]
+        # a cell reached from two frontier cells appears twice; keep the
+        # copy that wins the scatter into owner
+        positions = np.arange(candidates.size)
+        owner[candidates] = positions
+        frontier = candidates[owner[candidates] == positions]
+        free[frontier] = False
+        distances[frontier] = layer
+        reached += frontier.size
+    return distances.reshape(rows + 2, width)[1:-1, 1:-1].ravel(), reached
+
+def descendPath(distances: np.ndarray, cols: int, goal: int) -> list[int]:
+    """_summary_ rebuilds a shortest path from a BFS distance array by stepping from the
+    goal to any neighbor one layer closer to the start, until the start is reached
+
+    Args:
+        distances (np.ndarray): BFS distance of every cell (-1 where not reached)
+        cols (int): number of columns in the grid
+        goal (int): index of the goal cell, which must have been reached
+
+    Returns:
+        list[int]: cell indices running from the goal back to the start
+    """
+    n = distances.size
+    path = [goal]
+    index = goal
+    distance = int(distances[goal])
+    while distance > 0:
+        col = index % cols
+        for neighbor, valid in ((index - cols, index >= cols), (index + cols, index < n - cols),
+                                (index - 1, col > 0), (index + 1, col < cols - 1)):
+            if valid and distances[neighbor] == distance - 1:
+                index = neighbor
+                break
+        distance -= 1
+        path.append(index)
+    return path
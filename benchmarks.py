@@ -0,0 +1,739 @@
+from Maze import *
+from Maze import _DIRECTIONS
+from LinkedList import LinkedList
+from Replanner import DStarLite
+
+from statistics import median
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+
+SEED = 8675309   # every benchmark maze is built from random.Random(SEED)
+
+def _bestOf(func, repeats: int = 3) -> float:
+    """_summary_ times a zero-argument callable several times and keeps the fastest run
+
+    Args:
+        func: the callable to time
+        repeats (int): how many times to run it
+
+    Returns:
+        float: the fastest wall time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - begin)
+    return best
+
+def _listVisitedSearch(maze: Maze, container) -> int:
+    """_summary_ the original dfs/bfs loop, which keeps visited positions in a list
+    and so does a linear scan for every neighbor; kept here only as a reference point
+
+    Args:
+        maze (Maze): the maze to search
+        container: an empty Stack or Queue
+
+    Returns:
+        int: number of cells explored
+    """
+    container.push(maze._start)
+    visitedCells = [maze._start.getPosition()]
+    explored = 0
+    while len(container) > 0:
+        currentCell = container.pop()
+        if currentCell.isGoal():
+            break
+        for neighbor in maze.getSearchLocations(currentCell):
+            if neighbor.getPosition() not in visitedCells:
+                visitedCells.append(neighbor.getPosition())
+                neighbor.setParent(currentCell)
+                container.push(neighbor)
+                explored += 1
+    return explored
+
+def benchmarkVisited(sizes: list[int] = [50, 100, 200], prop_blocked: float = 0.1) -> None:
+    """_summary_ compares the list-based visited check against the bytearray one
+    used by Maze.dfs and Maze.bfs, on the same seeded mazes
+
+    Args:
+        sizes (list[int]): side lengths of the square mazes to time
+        prop_blocked (float): proportion of blocked cells
+    """
+    for size in sizes:
+        for name, method, container in (("dfs", Maze.dfs, Stack), ("bfs", Maze.bfs, Queue)):
+            random.seed(8675309)
+            m = Maze(size, size, prop_blocked=prop_blocked, search_order=SearchOrder.NSWE)
+            old = _bestOf(lambda: _listVisitedSearch(m, container()), repeats=1)
+            new = _bestOf(lambda: method(m))
+            print(f"{name} {size}x{size}: list {old:.4f}s  bytearray {new:.4f}s  speedup {old / new:.1f}x")
+
+def benchmarkStorage(sizes: list[int] = [100, 500, 1000]) -> None:
+    """_summary_ compares the memory held by a Maze with its 2D list of Cell objects
+    against a compact Maze that keeps one byte per cell
+
+    Args:
+        sizes (list[int]): side lengths of the square mazes to build
+    """
+    for size in sizes:
+        for compact in (False, True):
+            random.seed(8675309)
+            tracemalloc.start()
+            m = Maze(size, size, prop_blocked=0.25, compact=compact)
+            held, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{size}x{size} {'compact' if compact else 'cells  '}: {held / (size * size):.1f} bytes per cell")
+            del m
+
+def _originalSearchLocations(grid: list[list[Cell]], order: SearchOrder, cell: Cell) -> list[Cell]:
+    """_summary_ a copy of getSearchLocations as it was before the adjacency tables, when the
+    Maze kept a grid of Cell objects: bounds checks and an isBlocked call per neighbor
+
+    Args:
+        grid (list[list[Cell]]): the Cell of every position, by row then column
+        order (SearchOrder): a deterministic search order
+        cell (Cell): the current Cell being explored
+
+    Returns:
+        list[Cell]: the open neighbors of the cell, in search order
+    """
+    validNeigh = []
+    currentRow, currentCol = cell.getPosition()
+    for nextRow, nextCol in _DIRECTIONS[order]:
+        newRow = currentRow + nextRow
+        newCol = currentCol + nextCol
+        if newRow >= 0 and newRow < len(grid) and newCol >= 0 and newCol < len(grid[0]):
+            neighCell = grid[newRow][newCol]
+            if not neighCell.isBlocked():
+                validNeigh.append(neighCell)
+    return validNeigh
+
+def benchmarkNeighbors(sizes: list[int] = [100, 500], order: SearchOrder = SearchOrder.NSWE) -> None:
+    """_summary_ times listing the neighbors of every open cell three ways: the original
+    getSearchLocations (a copy of it, over a grid of Cell objects), working them out per cell
+    from the grid bytes, and reading them from the precomputed adjacency table
+
+    Args:
+        sizes (list[int]): side lengths of the square mazes to time
+        order (SearchOrder): a deterministic search order
+    """
+    for size in sizes:
+        random.seed(8675309)
+        m = Maze(size, size, prop_blocked=0.25, search_order=order)
+        grid = [[m.getCell(Position(r, c)) for c in range(size)] for r in range(size)]
+        cells = [cell for row in grid for cell in row if not cell.isBlocked()]
+        indices = [m._index(cell._position) for cell in cells]
+        build = _bestOf(lambda: m._buildAdjacency(order), repeats=1)
+        lookup = m._neighborLookup()
+        old = _bestOf(lambda: [_originalSearchLocations(grid, order, cell) for cell in cells])
+        computed = _bestOf(lambda: [m._openNeighbors(i) for i in indices])
+        table = _bestOf(lambda: [lookup(i) for i in indices])
+        print(f"neighbors {size}x{size}: original {old:.4f}s  computed {computed:.4f}s  "
+              f"table {table:.4f}s (built once in {build:.4f}s)  speedup {old / table:.1f}x")
+
+def benchmarkWavefront(sizes: list[int] = [200, 1000, 2000], prop_blocked: float = 0.1) -> None:
+    """_summary_ compares the cell-at-a-time bfs against the numpy layer-at-a-time one,
+    checking that both find paths of the same length
+
+    Args:
+        sizes (list[int]): side lengths of the square mazes to time
+        prop_blocked (float): proportion of blocked cells
+    """
+    for size in sizes:
+        random.seed(8675309)
+        m = Maze(size, size, prop_blocked=prop_blocked, search_order=SearchOrder.NSWE, compact=True)
+        m.bfs()  # builds the neighbor table outside the timing
+        queue = _bestOf(lambda: m.bfs(), repeats=1)
+        layers = _bestOf(lambda: m.bfs(vectorized=True))
+        assert m.bfs().getPathLength() == m.bfs(vectorized=True).getPathLength()
+        print(f"bfs {size}x{size}: queue {queue:.4f}s  wavefront {layers:.4f}s  speedup {queue / layers:.1f}x")
+
+def benchmarkJumpPoints(sizes: list[int] = [50, 200, 500], prop_blocked: float = 0.05) -> None:
+    """_summary_ compares plain aStar with Jump Point Search: time, and cells pushed onto
+    the priority queue, checking that both find paths of the same length
+
+    Args:
+        sizes (list[int]): side lengths of the square mazes to time
+        prop_blocked (float): proportion of blocked cells
+    """
+    for size in sizes:
+        random.seed(8675309)
+        m = Maze(size, size, prop_blocked=prop_blocked, search_order=SearchOrder.NSWE, compact=True)
+        plain, jumps = m.aStar(), m.aStar(jump_points=True)
+        assert plain.getPathLength() == jumps.getPathLength()
+        plain_time = _bestOf(lambda: m.aStar())
+        jumps_time = _bestOf(lambda: m.aStar(jump_points=True))
+        print(f"aStar {size}x{size}: pushes {plain.getNumCellsExplored()} vs {jumps.getNumCellsExplored()} jump points, "
+              f"time {plain_time:.4f}s vs {jumps_time:.4f}s")
+
+def benchmarkIndexedQueue(sizes: list[int] = [50, 200, 500], prop_blocked: float = 0.1) -> None:
+    """_summary_ runs aStar with the plain heap and with the indexed heap (which lowers
+    keys in place), printing heap size and pop counts for each
+
+    Args:
+        sizes (list[int]): side lengths of the square mazes to search
+        prop_blocked (float): proportion of blocked cells
+    """
+    for size in sizes:
+        random.seed(8675309)
+        m = Maze(size, size, prop_blocked=prop_blocked, search_order=SearchOrder.NSWE, compact=True)
+        for queue_type in (PriorityQueue, IndexedPriorityQueue):
+            queue = queue_type()
+            result = m.aStar(queue=queue)
+            elapsed = _bestOf(lambda: m.aStar(queue=queue_type()))
+            print(f"aStar {size}x{size} {queue_type.__name__:20}: path {result.getPathLength()}  "
+                  f"{queue.getStats()}  {elapsed:.4f}s")
+
+def benchmarkBucketQueue(sizes: list[int] = [50, 200, 500, 1000, 2000], prop_blocked: float = 0.1) -> None:
+    """_summary_ times aStar with the binary heap against the bucket queue, which can be
+    used because every f value is a small non-negative int
+
+    Args:
+        sizes (list[int]): side lengths of the square mazes to search
+        prop_blocked (float): proportion of blocked cells
+    """
+    for size in sizes:
+        random.seed(8675309)
+        m = Maze(size, size, prop_blocked=prop_blocked, search_order=SearchOrder.NSWE, compact=True)
+        assert m.aStar().getPathLength() == m.aStar(queue=BucketQueue()).getPathLength()
+        heap = _bestOf(lambda: m.aStar())
+        buckets = _bestOf(lambda: m.aStar(queue=BucketQueue()))
+        print(f"aStar {size}x{size}: heap {heap:.4f}s  buckets {buckets:.4f}s  speedup {heap / buckets:.2f}x")
+
+def benchmarkTieBreaking(size: int = 50, prop_blocked: float = 0.25, seeds: int = 30) -> None:
+    """_summary_ totals the cells aStar explores with and without tie-breaking on equal f,
+    checking that path lengths do not change
+
+    Args:
+        size (int): side length of the square mazes to search
+        prop_blocked (float): proportion of blocked cells
+        seeds (int): number of seeded mazes
+    """
+    totals = {True: 0, False: 0}
+    for seed in range(seeds):
+        random.seed(seed)
+        m = Maze(size, size, prop_blocked=prop_blocked, search_order=SearchOrder.NSWE, compact=True)
+        with_ties, without = m.aStar(tie_break=True), m.aStar(tie_break=False)
+        assert with_ties.getPathLength() == without.getPathLength()
+        totals[True] += with_ties.getNumCellsExplored()
+        totals[False] += without.getNumCellsExplored()
+    print(f"aStar {size}x{size} over {seeds} seeds: {totals[False]} cells explored without tie-breaking, "
+          f"{totals[True]} with")
+
+def benchmarkInstrumentation(size: int = 200, prop_blocked: float = 0.2) -> None:
+    """_summary_ times each search with and without a SearchStats being passed, then prints
+    the totals it collected
+
+    Args:
+        size (int): side length of the square maze to search
+        prop_blocked (float): proportion of blocked cells
+    """
+    m = Maze(size, size, prop_blocked=prop_blocked, search_order=SearchOrder.NSWE, compact=True,
+             rng=random.Random(SEED))
+    stats = SearchStats()
+    for method in ("dfs", "bfs", "aStar"):
+        search = getattr(m, method)
+        plain = _bestOf(search, repeats=10)
+        tracked = _bestOf(lambda: search(stats=stats), repeats=10)
+        print(f"{method} {size}x{size}: without stats {plain:.4f}s  with stats {tracked:.4f}s  "
+              f"overhead {100.0 * (tracked - plain) / plain:+.1f}%")
+    print(stats)
+
+def benchmarkComponents(size: int = 50, prop_blocked: float = 0.3, seeds: int = 200) -> None:
+    """_summary_ times bfs over many seeded mazes with and without component labels, which
+    let a search return at once when the goal cannot be reached; building the labels is
+    timed separately, since it is paid once per maze rather than once per search
+
+    Args:
+        size (int): side length of the square mazes to search
+        prop_blocked (float): proportion of blocked cells
+        seeds (int): number of seeded mazes
+    """
+    mazes = [Maze(size, size, prop_blocked=prop_blocked, compact=True, rng=random.Random(seed))
+             for seed in range(seeds)]
+    unreachable = sum(not m.bfs().isFound() for m in mazes)
+    plain = _bestOf(lambda: [m.bfs() for m in mazes])
+
+    def build() -> None:
+        for m in mazes:
+            m._components = None
+            m.isReachable()
+    building = _bestOf(build)
+    labelled = _bestOf(lambda: [m.bfs() for m in mazes])
+    print(f"bfs {size}x{size} over {seeds} mazes ({unreachable} unreachable): plain {plain:.4f}s  "
+          f"labelled {labelled:.4f}s (building the labels {building:.4f}s)")
+
+def benchmarkSolveMany(size: int = 200, prop_blocked: float = 0.25, queries: int = 200, workers: int = 4) -> None:
+    """_summary_ times a batch of random (start, goal) queries on one maze with solveMany,
+    answered one after another, on threads, and on processes
+
+    Args:
+        size (int): side length of the square maze to search
+        prop_blocked (float): proportion of blocked cells
+        queries (int): number of (start, goal) pairs
+        workers (int): number of threads or processes
+    """
+    rng = random.Random(SEED)
+    m = Maze(size, size, prop_blocked=prop_blocked, compact=True, rng=rng)
+    pairs = [(Position(rng.randrange(size), rng.randrange(size)), Position(rng.randrange(size), rng.randrange(size)))
+             for _ in range(queries)]
+    for algorithm in ("bfs", "aStar"):
+        found = sum(result.found for result in m.solveMany(pairs, algorithm))
+        serial = _bestOf(lambda: m.solveMany(pairs, algorithm), repeats=1)
+        threads = _bestOf(lambda: m.solveMany(pairs, algorithm, workers), repeats=1)
+        processes = _bestOf(lambda: m.solveMany(pairs, algorithm, workers, processes=True), repeats=1)
+        print(f"{algorithm} {size}x{size}, {queries} queries ({found} found): serial {serial:.4f}s  "
+              f"{workers} threads {threads:.4f}s  {workers} processes {processes:.4f}s")
+
+def benchmarkDistanceField(size: int = 200, prop_blocked: float = 0.2, queries: int = 200) -> None:
+    """_summary_ times answering many starts for the Maze goal with one bfs per start, and by
+    descending the goal's distance field (including building it once)
+
+    Args:
+        size (int): side length of the square maze to search
+        prop_blocked (float): proportion of blocked cells
+        queries (int): number of starts
+    """
+    rng = random.Random(SEED)
+    m = Maze(size, size, prop_blocked=prop_blocked, compact=True, rng=rng)
+    goal = m.getGoal().getPosition()
+    pairs = [(Position(rng.randrange(size), rng.randrange(size)), goal) for _ in range(queries)]
+    assert [result.path_length for result in m.solveMany(pairs, "bfs")] == \
+           [result.path_length for result in m.solveMany(pairs, "fieldPath")]
+    searched = _bestOf(lambda: m.solveMany(pairs, "bfs"), repeats=1)
+
+    def descended() -> None:
+        m._distance_fields.clear()
+        m.solveMany(pairs, "fieldPath")
+    field = _bestOf(descended, repeats=1)
+    print(f"{queries} starts, one goal, {size}x{size}: bfs each {searched:.4f}s  distance field {field:.4f}s  "
+          f"speedup {searched / field:.1f}x")
+
+def benchmarkReplanning(size: int = 300, prop_blocked: float = 0.2, edits: int = 30) -> None:
+    """_summary_ repeatedly blocks a cell on the current path, timing the D* Lite repair
+    against a fresh aStar on the changed maze
+
+    Args:
+        size (int): side length of the square maze
+        prop_blocked (float): proportion of blocked cells
+        edits (int): number of cells blocked, one per replan
+    """
+    rng = random.Random(SEED)
+    m = Maze(size, size, prop_blocked=prop_blocked, compact=True, rng=random.Random(2))
+    planner = DStarLite(m)
+    first = _bestOf(planner.plan, repeats=1)
+    result = planner.plan()
+    repairs, fresh, expansions = 0.0, 0.0, 0
+    for _ in range(edits):
+        if not result.isFound():
+            break
+        path = result.getPath()
+        blocked = path[rng.randrange(1, len(path) - 1)]
+        begin = time.perf_counter()
+        result = planner.replan([blocked])
+        repairs += time.perf_counter() - begin
+        expansions += planner.getNumExpansions()
+        begin = time.perf_counter()
+        assert m.aStar().getPathLength() == result.getPathLength()
+        fresh += time.perf_counter() - begin
+    print(f"{size}x{size}: first plan {first:.4f}s; per edit on the path: replan {repairs / edits:.4f}s "
+          f"({expansions / edits:.0f} expansions)  fresh aStar {fresh / edits:.4f}s")
+
+def benchmarkSteps(size: int = 200, prop_blocked: float = 0.2) -> None:
+    """_summary_ times each search as called normally (which drains its generator version),
+    against stepping through the generator in a Python loop, with and without push events
+
+    Args:
+        size (int): side length of the square maze to search
+        prop_blocked (float): proportion of blocked cells
+    """
+    m = Maze(size, size, prop_blocked=prop_blocked, search_order=SearchOrder.NSWE, compact=True,
+             rng=random.Random(3))
+
+    def stepThrough(steps) -> None:
+        for event, value in steps:
+            pass
+
+    for method in ("dfs", "bfs", "aStar"):
+        steps = getattr(m, method + "Steps")
+        called = _bestOf(getattr(m, method), repeats=10)
+        looped = _bestOf(lambda: stepThrough(steps()), repeats=10)
+        pushes = _bestOf(lambda: stepThrough(steps(pushes=True)), repeats=10)
+        print(f"{method} {size}x{size}: called {called:.4f}s  stepped {looped:.4f}s  "
+              f"stepped with pushes {pushes:.4f}s")
+
+def benchmarkGeneration(sizes: list[int] = [500, 1000, 2000], prop_blocked: float = 0.25) -> None:
+    """_summary_ times building a compact maze with the blocked cells drawn by random.sample
+    (the default, which keeps mazes the same for a given rng) against drawing them with
+    numpy (fast_generation)
+
+    Args:
+        sizes (list[int]): side lengths of the square mazes to build
+        prop_blocked (float): proportion of blocked cells
+    """
+    for size in sizes:
+        exact = _bestOf(lambda: Maze(size, size, prop_blocked=prop_blocked, compact=True,
+                                     rng=random.Random(3)))
+        fast = _bestOf(lambda: Maze(size, size, prop_blocked=prop_blocked, compact=True,
+                                    rng=random.Random(3), fast_generation=True))
+        print(f"generate {size}x{size}: random.sample {exact:.4f}s  numpy {fast:.4f}s  "
+              f"speedup {exact / fast:.1f}x")
+
+def benchmarkMazeFiles(sizes: list[int] = [500, 1000, 2000], prop_blocked: float = 0.25) -> None:
+    """_summary_ times getting a compact maze by generating it against loading it from a file
+    saved with a byte per cell (memory-mapped) and with a bit per cell (unpacked)
+
+    Args:
+        sizes (list[int]): side lengths of the square mazes
+        prop_blocked (float): proportion of blocked cells
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            generate = lambda: Maze(size, size, prop_blocked=prop_blocked, compact=True, rng=random.Random(SEED))
+            m = generate()
+            byte_path, bit_path = os.path.join(directory, "byte.maze"), os.path.join(directory, "bit.maze")
+            m.save(byte_path)
+            m.save(bit_path, packed=True)
+            generated = _bestOf(generate)
+            mapped = _bestOf(lambda: Maze.load(byte_path, compact=True))
+            unpacked = _bestOf(lambda: Maze.load(bit_path, compact=True))
+            print(f"maze {size}x{size}: generate {generated:.4f}s  load mapped {mapped:.5f}s "
+                  f"({os.path.getsize(byte_path)} bytes)  load packed {unpacked:.4f}s "
+                  f"({os.path.getsize(bit_path)} bytes)")
+
+def benchmarkTiles(size: int = 4000, prop_blocked: float = 0.2, budgets: list[int] = [1 << 16, 1 << 20, 1 << 24]) -> None:
+    """_summary_ times aStar on a maze held in memory against the same maze loaded tiled, with
+    several tile-cache budgets, reporting how often tiles were read and how much they took up
+
+    Args:
+        size (int): side length of the square maze
+        prop_blocked (float): chance of each cell being blocked
+        budgets (list[int]): tile-cache budgets to try, in bytes
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tiled.maze")
+        Maze.generateFile(path, size, size, start=Position(size // 8, size // 8),
+                          goal=Position(size // 2, size // 3), prop_blocked=prop_blocked, seed=SEED)
+        m = Maze.load(path, compact=True)
+        print(f"aStar {size}x{size} in memory: {_bestOf(m.aStar):.4f}s")
+        for budget in budgets:
+            tiled = Maze.load(path, tiled=True, cache_bytes=budget)
+            seconds = _bestOf(tiled.aStar)
+            print(f"aStar {size}x{size} tiled, {budget >> 10}KB budget: {seconds:.4f}s  "
+                  f"tile reads {tiled._cells.getNumTileLoads()}  tiles held {tiled._cells.getCacheBytes() >> 10}KB")
+
+def benchmarkRender(size: int = 2000, prop_blocked: float = 0.25) -> None:
+    """_summary_ times and measures the peak memory of building the whole str of a maze against
+    rendering it a row at a time with a path drawn over it
+
+    Args:
+        size (int): side length of the square maze
+        prop_blocked (float): proportion of blocked cells
+    """
+    m = Maze(size, size, prop_blocked=prop_blocked, compact=True, rng=random.Random(SEED))
+    result = m.bfs()
+    with open(os.devnull, "w") as devnull:
+        for name, func in (("str", lambda: devnull.write(str(m))),
+                           ("render", lambda: m.render(devnull, path=result))):
+            seconds = _bestOf(func)
+            tracemalloc.start()
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{name} {size}x{size}: {seconds:.4f}s  peak memory {peak >> 10}KB")
+
+def benchmarkIdaStar(sizes: list[int] = [200, 500, 1000], prop_blocked: float = 0.05,
+                     table_sizes: list[int] = [4096, 65536], walled_off_seeds: list[int] = [3, 6]) -> None:
+    """_summary_ times and measures the peak memory of aStar against idaStar with transposition
+    tables of several sizes (the neighbor tables aStar reads are built beforehand, so they are
+    not counted against it), then times idaStar with its default table on 40x40 mazes, 30%
+    blocked as in experiments.py, whose goal is walled off from the start, checking that they
+    are found walled off as well after being saved and loaded (mapped, unpacked and tiled)
+
+    Args:
+        sizes (list[int]): side lengths of the square mazes to search
+        prop_blocked (float): proportion of blocked cells
+        table_sizes (list[int]): idaStar table sizes to try (0 for none)
+        walled_off_seeds (list[int]): seeds of 40x40 mazes whose goal cannot be reached
+    """
+    for size in sizes:
+        m = Maze(size, size, prop_blocked=prop_blocked, compact=True, rng=random.Random(SEED))
+        m.aStar()
+        searches = [("aStar", m.aStar)] + \
+                   [(f"idaStar table {table_size}", lambda table_size=table_size: m.idaStar(table_size))
+                    for table_size in table_sizes]
+        for name, search in searches:
+            seconds = _bestOf(search)
+            tracemalloc.start()
+            result = search()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{name} {size}x{size}: {seconds:.4f}s  peak memory {peak >> 10}KB  "
+                  f"path length {result.getPathLength()}  cells explored {result.getNumCellsExplored()}")
+    with tempfile.TemporaryDirectory() as directory:
+        byte_path, bit_path = os.path.join(directory, "byte.maze"), os.path.join(directory, "bit.maze")
+        for seed in walled_off_seeds:
+            m = Maze(40, 40, prop_blocked=0.3, compact=True, rng=random.Random(seed))
+            stats = SearchStats()
+            assert not m.idaStar(stats=stats).isFound() and not m.bfs().isFound()
+            m.save(byte_path)
+            m.save(bit_path, packed=True)
+            for loaded in (Maze.load(byte_path, compact=True), Maze.load(bit_path, compact=True),
+                           Maze.load(bit_path, tiled=True, tile_size=8)):
+                assert not loaded.idaStar().isFound()
+            print(f"idaStar walled off 40x40 seed {seed}: {_bestOf(m.idaStar):.4f}s  expansions {stats.expansions}")
+
+def benchmarkWeighted(sizes: list[int] = [200, 500], prop_blocked: float = 0.1, prop_cheap: float = 0.8,
+                      max_cost: int = 9) -> None:
+    """_summary_ times dijkstra against cost-aware aStar on mazes where most cells cost 1 to
+    enter and the rest cost from 2 to max_cost, checking that both find equally cheap paths (the
+    closer the typical cost is to the least one, the better the scaled heuristic guides aStar)
+
+    Args:
+        sizes (list[int]): side lengths of the square mazes to search
+        prop_blocked (float): proportion of blocked cells
+        prop_cheap (float): proportion of cells costing 1
+        max_cost (int): highest cell cost
+    """
+    for size in sizes:
+        rng = random.Random(SEED)
+        m = Maze(size, size, prop_blocked=prop_blocked, compact=True, rng=rng)
+        m.setCosts([1 if rng.random() < prop_cheap else rng.randint(2, max_cost) for _ in range(size * size)])
+        for name, search in (("dijkstra", m.dijkstra), ("aStar", m.aStar),
+                             ("aStar bucket queue", lambda stats=None: m.aStar(queue=BucketQueue(), stats=stats))):
+            stats = SearchStats()
+            result = search(stats=stats)
+            print(f"{name} {size}x{size}: {_bestOf(search):.4f}s  expansions {stats.expansions}  "
+                  f"stale pops {stats.stale_pops}  path cost {result.getPathCost()}")
+
+def benchmarkDiagonal(sizes: list[int] = [200, 500], prop_blocked: float = 0.1) -> None:
+    """_summary_ searches the same mazes moving four ways (NSWE) and eight ways (NSWE8), comparing
+    times, expansions and path lengths for bfs and aStar (with the heap and with the bucket
+    queue, whose keys and ties grow tenfold moving eight ways); the eight-way path cost is in
+    tenths of a straight move, so it reads against ten times the four-way path length
+
+    Args:
+        sizes (list[int]): side lengths of the square mazes to search
+        prop_blocked (float): proportion of blocked cells
+    """
+    for size in sizes:
+        for order in (SearchOrder.NSWE, SearchOrder.NSWE8):
+            m = Maze(size, size, prop_blocked=prop_blocked, search_order=order, compact=True,
+                     rng=random.Random(SEED))
+            for name, search in (("bfs", m.bfs), ("aStar", m.aStar),
+                                 ("aStar bucket queue", lambda stats=None: m.aStar(queue=BucketQueue(), stats=stats))):
+                stats = SearchStats()
+                result = search(stats=stats)
+                print(f"{name} {order.name} {size}x{size}: {_bestOf(search):.4f}s  expansions {stats.expansions}  "
+                      f"path length {result.getPathLength()}  path cost {result.getPathCost()}")
+
+################################################################################
+# the benchmark suite: every case is timed after warmup runs, several times,
+# and the results are written to JSON so a later run can be compared to them
+
+def timeCase(func, setup = None, warmup: int = 1, repeats: int = 5) -> dict[str, float]:
+    """_summary_ times a zero-argument callable after some untimed warmup runs
+
+    Args:
+        func: the callable to time
+        setup: optional zero-argument callable run (untimed) before every run of func
+        warmup (int): number of untimed runs first
+        repeats (int): number of timed runs
+
+    Returns:
+        dict[str, float]: min, median and max wall time in seconds, and the number of repeats
+    """
+    times = []
+    for run in range(warmup + repeats):
+        if setup is not None:
+            setup()
+        begin = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - begin
+        if run >= warmup:
+            times.append(elapsed)
+    return {"min": min(times), "median": median(times), "max": max(times), "repeats": repeats}
+
+def _benchMaze(size: int, prop_blocked: float, search_order: SearchOrder,
+               corpus: str = None) -> tuple[Maze, random.Random]:
+    rng = random.Random(SEED)
+    if corpus is None:
+        return Maze(size, size, prop_blocked=prop_blocked, search_order=search_order, compact=True, rng=rng), rng
+    # load the maze from the shared corpus, saving it there the first time
+    path = _corpusPath(corpus, size, prop_blocked)
+    if not os.path.exists(path):
+        os.makedirs(corpus, exist_ok=True)
+        Maze(size, size, prop_blocked=prop_blocked, compact=True, rng=random.Random(SEED)).save(path)
+    return Maze.load(path, search_order=search_order, compact=True, rng=rng), rng
+
+def _corpusPath(corpus: str, size: int, prop_blocked: float) -> str:
+    return os.path.join(corpus, f"maze_{size}_{prop_blocked}_{SEED}.maze")
+
+def mazeCases(sizes: list[int], props_blocked: list[float], search_orders: list[SearchOrder],
+              corpus: str = None) -> dict:
+    """_summary_ builds the Maze benchmark cases: construction (and, given a corpus, loading) per
+    size and blocking ratio, and getSearchLocations, dfs, bfs and aStar per size, blocking ratio
+    and search order
+
+    Args:
+        corpus (str): directory of saved mazes to search rather than generating them (each is
+            saved there the first time it is needed), or None to generate every maze
+
+    Returns:
+        dict: case name -> (func, setup) to pass to timeCase
+    """
+    cases = {}
+    for size in sizes:
+        for prop in props_blocked:
+            cases[f"Maze.__init__/{size}/{prop}"] = \
+                (lambda size=size, prop=prop: Maze(size, size, prop_blocked=prop, compact=True, rng=random.Random(SEED)), None)
+            for order in search_orders:
+                m, rng = _benchMaze(size, prop, order, corpus)
+                # reseeding before each run keeps SearchOrder.RANDOM repeatable
+                setup = lambda rng=rng: rng.seed(SEED)
+                cells = [m.getCell(Position(r, c)) for r in range(size) for c in range(size)]
+                cells = [cell for cell in cells if not cell.isBlocked()]
+                key = f"{size}/{prop}/{order.name}"
+                cases[f"Maze.getSearchLocations/{key}"] = \
+                    (lambda m=m, cells=cells: [m.getSearchLocations(cell) for cell in cells], setup)
+                for method in ("dfs", "bfs", "aStar"):
+                    cases[f"Maze.{method}/{key}"] = (getattr(m, method), setup)
+            if corpus is not None:
+                cases[f"Maze.load/{size}/{prop}"] = \
+                    (lambda path=_corpusPath(corpus, size, prop): Maze.load(path, compact=True), None)
+    return cases
+
+def containerCases(count: int) -> dict:
+    """_summary_ builds push/pop throughput cases for Stack, Queue, PriorityQueue and LinkedList:
+    each pushes count items and then pops them all
+
+    Returns:
+        dict: case name -> (func, setup) to pass to timeCase
+    """
+    keys = random.Random(SEED).choices(range(count), k=count)
+
+    def stack():
+        s = Stack()
+        for i in range(count): s.push(i)
+        while not s.is_empty(): s.pop()
+
+    def queue():
+        q = Queue()
+        for i in range(count): q.push(i)
+        while not q.isEmpty(): q.pop()
+
+    def priorityQueue():
+        pq = PriorityQueue()
+        for i, key in enumerate(keys): pq.insert(key, i)
+        while not pq.isEmpty(): pq.removeMin()
+
+    def linkedList():
+        ll = LinkedList()
+        for i in range(count): ll.addRight(i)
+        while len(ll) > 0: ll.removeLeft()
+
+    return {f"Stack/{count}": (stack, None), f"Queue/{count}": (queue, None),
+            f"PriorityQueue/{count}": (priorityQueue, None), f"LinkedList/{count}": (linkedList, None)}
+
+def runSuite(cases: dict, warmup: int = 1, repeats: int = 5) -> dict:
+    """_summary_ times every case, printing each as it finishes
+
+    Returns:
+        dict: the run's settings and environment under "meta", and timeCase's numbers per case under "results"
+    """
+    results = {}
+    for name, (func, setup) in cases.items():
+        results[name] = timeCase(func, setup, warmup, repeats)
+        print(f"{name:50} median {results[name]['median']:.6f}s")
+    meta = {"python": platform.python_version(), "machine": platform.machine(), "seed": SEED,
+            "warmup": warmup, "repeats": repeats, "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    return {"meta": meta, "results": results}
+
+def compareToBaseline(run: dict, baseline: dict, threshold: float = 10.0) -> list[str]:
+    """_summary_ prints the percentage change in median time of every case also in the baseline
+
+    Args:
+        run (dict): output of runSuite
+        baseline (dict): an earlier output of runSuite
+        threshold (float): percentage slowdown above which a case counts as a regression
+
+    Returns:
+        list[str]: names of the cases that regressed
+    """
+    regressions = []
+    for name, numbers in run["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["median"]
+        change = 100.0 * (numbers["median"] - before) / before
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:50} {before:.6f}s -> {numbers['median']:.6f}s  {change:+7.1f}%{flag}")
+    return regressions
+
+def runComparisons() -> None:
+    ''' runs the one-off comparisons above, each printing its own results '''
+    benchmarkVisited()
+    benchmarkStorage()
+    benchmarkNeighbors()
+    benchmarkWavefront()
+    benchmarkJumpPoints()
+    benchmarkIndexedQueue()
+    benchmarkBucketQueue()
+    benchmarkTieBreaking()
+    benchmarkInstrumentation()
+    benchmarkComponents()
+    benchmarkSolveMany()
+    benchmarkDistanceField()
+    benchmarkReplanning()
+    benchmarkSteps()
+    benchmarkGeneration()
+    benchmarkMazeFiles()
+    benchmarkTiles()
+    benchmarkRender()
+    benchmarkIdaStar()
+    benchmarkWeighted()
+    benchmarkDiagonal()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="time the maze searches and data structures")
+    parser.add_argument("--output", default="benchmark_results.json", help="where to write this run's results")
+    parser.add_argument("--baseline", help="results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent slowdown that counts as a regression")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--blocked", type=float, nargs="+", default=[0.1, 0.25])
+    parser.add_argument("--orders", nargs="+", default=[order.name for order in SearchOrder],
+                        choices=[order.name for order in SearchOrder])
+    parser.add_argument("--count", type=int, default=100000, help="items pushed per data structure case")
+    parser.add_argument("--corpus", help="directory of saved mazes to load (and fill) instead of regenerating")
+    parser.add_argument("--comparisons", action="store_true", help="run the one-off comparisons instead")
+    args = parser.parse_args()
+
+    if args.comparisons:
+        runComparisons()
+        return
+
+    cases = mazeCases(args.sizes, args.blocked, [SearchOrder[name] for name in args.orders], args.corpus)
+    cases.update(containerCases(args.count))
+    run = runSuite(cases, args.warmup, args.repeats)
+    with open(args.output, "w") as f:
+        json.dump(run, f, indent=2)
+    print(f"results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compareToBaseline(run, baseline, args.threshold)
+        print(f"{len(regressions)} case(s) slower than the baseline by more than {args.threshold}%")
+
+if __name__ == "__main__":
+    main()
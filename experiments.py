@@ -1,4 +1,104 @@
 from Maze import *
+from Maze import _mapInChunks
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+import argparse
+import os
+import time
+
+class ExperimentJob(NamedTuple):
+    ''' one search to run: which algorithm, on which seeded maze '''
+    seed:         int
+    algorithm:    str          # name of a Maze search method, e.g. "bfs"
+    size:         int          # the maze is size x size
+    prop_blocked: float
+    search_order: SearchOrder
+
+class ExperimentRecord(NamedTuple):
+    ''' the outcome of one ExperimentJob '''
+    job:                ExperimentJob
+    found:              bool
+    path_length:        int
+    num_cells_explored: int
+    seconds:            float  # time spent searching (not building the maze)
+
+def makeJobs(seeds: list[int], algorithms: list[str], sizes: list[int], \
+             props_blocked: list[float], search_orders: list[SearchOrder]) -> list[ExperimentJob]:
+    """_summary_ builds one job for every combination of the given settings
+
+    Returns:
+        list[ExperimentJob]: the jobs, ordered by seed, then algorithm, size, proportion, order
+    """
+    return [ExperimentJob(*settings) for settings in product(seeds, algorithms, sizes, props_blocked, search_orders)]
+
+def runJob(job: ExperimentJob) -> ExperimentRecord:
+    """_summary_ builds the job's maze from its own seeded random.Random and searches it; the
+    maze (and any RANDOM search order) depends only on the job, not on which process runs it or
+    what it ran before, and is the same maze random.seed(job.seed) followed by Maze(...) gives
+
+    Args:
+        job (ExperimentJob): the search to run
+
+    Returns:
+        ExperimentRecord: what the search found
+    """
+    m = Maze(job.size, job.size, prop_blocked=job.prop_blocked, search_order=job.search_order,
+             compact=True, rng=random.Random(job.seed))
+    begin = time.perf_counter()
+    result = getattr(m, job.algorithm)()
+    seconds = time.perf_counter() - begin
+    return ExperimentRecord(job, result.isFound(), result.getPathLength(), result.getNumCellsExplored(), seconds)
+
+def runExperiments(jobs: list[ExperimentJob], max_workers: int = None) -> list[ExperimentRecord]:
+    """_summary_ runs the jobs spread over a pool of worker processes
+
+    Args:
+        jobs (list[ExperimentJob]): the searches to run
+        max_workers (int): number of processes (one per core if not given); 1 runs
+            everything in this process
+
+    Returns:
+        list[ExperimentRecord]: one record per job, in the same order as jobs
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1:
+        return [runJob(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _mapInChunks(pool, runJob, jobs, workers)
+
+def summarize(records: list[ExperimentRecord]) -> dict[str, dict[str, float]]:
+    """_summary_ averages path length and cells explored per algorithm as main does: both are
+    totalled over every search (a search that did not find the goal has length 0) and divided
+    by the number of searches that found the goal
+
+    Args:
+        records (list[ExperimentRecord]): results of runExperiments
+
+    Returns:
+        dict[str, dict[str, float]]: per algorithm, the number of paths found and the averages
+    """
+    summary = {}
+    for record in records:
+        totals = summary.setdefault(record.job.algorithm, {"paths": 0, "length": 0, "cells": 0})
+        totals["cells"] += record.num_cells_explored
+        if record.found:
+            totals["paths"] += 1
+            totals["length"] += record.path_length
+    for totals in summary.values():
+        if totals["paths"] > 0:
+            totals["length"] /= totals["paths"]
+            totals["cells"] /= totals["paths"]
+    return summary
+
+def parallelMain(max_workers: int = None) -> None:
+    ''' runs the same sweep as main, spread over worker processes '''
+    random.seed(8675309)
+    seeds = [random.randint(1111111,9999999) for i in range(30)]
+    jobs = makeJobs(seeds, ["dfs", "bfs", "aStar", "bidirectionalBfs"], [50], [0.25], [SearchOrder.RANDOM])
+    for algorithm, totals in summarize(runExperiments(jobs, max_workers)).items():
+        print(f"{algorithm}: {totals['paths']} paths, average length {totals['length']} "
+              f"and average num cells {totals['cells']}")
 
 def main():
     random.seed(8675309)
@@ -9,42 +109,52 @@ def main():
     average_num_cells_bfs = 0
     average_num_cells_dfs = 0
     average_num_cells_astar = 0
+    average_length_bidirectional = 0
+    average_num_cells_bidirectional = 0
     bfs_goal = 0
     dfs_goal = 0
     aStar_goal = 0
+    bidirectional_goal = 0
 
     for seed in seeds:
         random.seed(seed)
-
         m = Maze(50,50, prop_blocked=0.25, search_order=SearchOrder.RANDOM)
-        goal = m.bfs()
-        m.calculatePathLength(goal)
-        print(f"BFS: cells explored = {m._num_cells_explored} and path length = {m._path_length}")
-        average_length_bfs+=m._path_length
-        average_num_cells_bfs+=m._num_cells_explored
-        if m._path_length != 0:
+        # the same maze is searched by all three algorithms; restoring the
+        # random state before each one gives each the same RANDOM ordering
+        state = random.getstate()
+
+        random.setstate(state)
+        result = m.bfs()
+        print(f"BFS: cells explored = {result.getNumCellsExplored()} and path length = {m.calculatePathLength(result)}")
+        average_length_bfs+=result.getPathLength()
+        average_num_cells_bfs+=result.getNumCellsExplored()
+        if result.getPathLength() != 0:
             bfs_goal+=1
         
             
-        random.seed(seed)
-        a = Maze(50,50, prop_blocked=0.25, search_order=SearchOrder.RANDOM)
-        goal = a.dfs()
-        a.calculatePathLength(goal)
-        print(f"DFS: cells explored = {a._num_cells_explored} and path length = {a._path_length}")
-        average_length_dfs+=a._path_length
-        average_num_cells_dfs+=a._num_cells_explored
-        if a._path_length != 0:
+        random.setstate(state)
+        result = m.dfs()
+        print(f"DFS: cells explored = {result.getNumCellsExplored()} and path length = {m.calculatePathLength(result)}")
+        average_length_dfs+=result.getPathLength()
+        average_num_cells_dfs+=result.getNumCellsExplored()
+        if result.getPathLength() != 0:
             dfs_goal+=1
         
-        random.seed(seed)
-        d = Maze(50,50, prop_blocked=0.25, search_order=SearchOrder.RANDOM)
-        goal = d.aStar()
-        d.calculatePathLength(goal)
-        print(f"aStar: cells explored = {d._num_cells_explored} and path length = {d._path_length}")
-        average_length_astar+=d._path_length
-        average_num_cells_astar+=d._num_cells_explored
-        if d._path_length != 0:
+        random.setstate(state)
+        result = m.aStar()
+        print(f"aStar: cells explored = {result.getNumCellsExplored()} and path length = {m.calculatePathLength(result)}")
+        average_length_astar+=result.getPathLength()
+        average_num_cells_astar+=result.getNumCellsExplored()
+        if result.getPathLength() != 0:
             aStar_goal+=1
+
+        random.setstate(state)
+        result = m.bidirectionalBfs()
+        print(f"bidirectional BFS: cells explored = {result.getNumCellsExplored()} and path length = {m.calculatePathLength(result)}")
+        average_length_bidirectional+=result.getPathLength()
+        average_num_cells_bidirectional+=result.getNumCellsExplored()
+        if result.getPathLength() != 0:
+            bidirectional_goal+=1
         
         print("\n")
 
@@ -54,14 +164,24 @@ def main():
     average_num_cells_bfs = average_num_cells_bfs / bfs_goal
     average_num_cells_dfs = average_num_cells_dfs / dfs_goal
     average_num_cells_astar = average_num_cells_astar / aStar_goal
+    average_length_bidirectional = average_length_bidirectional / bidirectional_goal
+    average_num_cells_bidirectional = average_num_cells_bidirectional / bidirectional_goal
 
     print(f"average length for dfs is {average_length_dfs} and average num cells is {average_num_cells_dfs}")
     print(f"average length for bfs is {average_length_bfs} and average num cells is {average_num_cells_bfs}")
     print(f"average length for astar is {average_length_astar} and average num cells is {average_num_cells_astar}")
+    print(f"average length for bidirectional bfs is {average_length_bidirectional} and average num cells is {average_num_cells_bidirectional}")
     print(f"dfs paths: {dfs_goal}")
     print(f"bfs paths: {bfs_goal}")
     print(f"astar paths: {aStar_goal}")
+    print(f"bidirectional bfs paths: {bidirectional_goal}")
 
 if __name__ == "__main__":
-
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="compare the maze searches over 30 seeded mazes")
+    parser.add_argument("--workers", type=int, help="run the sweep in this many worker processes "
+                                                    "(0 for one per CPU) instead of one after another")
+    args = parser.parse_args()
+    if args.workers is None:
+        main()
+    else:
+        parallelMain(args.workers or None)
\ No newline at end of file